@@ -0,0 +1,2294 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import SimpleNamespace
+
+import bmesh
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy_extras import view3d_utils
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from . import profiling
+from .geometry import (
+    bounds_overlap,
+    boxes_overlap_any,
+    cutter_outline,
+    extrude_cutter,
+    face_starts,
+    face_subset,
+    faces_in_bounds,
+    grid_pattern,
+    grow_face_region,
+    guide_pattern,
+    instance_bounds,
+    instances_overlapping,
+    is_closed_manifold,
+    is_flippable,
+    perspective_eye,
+    perspective_rays,
+    radial_pattern,
+    replicate_mesh,
+    reverse_face_winding,
+    signed_volume,
+    simplify_polyline,
+    tessellate_bezier,
+    to_local_direction,
+    through_depths,
+    transform_points,
+    validate_difference,
+    view_direction,
+)
+
+bl_info = {
+    "name": "CurveSlice Pro",
+    "author": "J.D. Siler",
+    "version": (1, 0),
+    "blender": (4, 0, 0),
+    "location": "View3D > CurveSlice Pro",
+    "description": "Description of your addon",
+    "wiki_url": "",
+    "category": "3D View",
+}
+
+class FlipNormalsOperator(bpy.types.Operator):
+    bl_idname = "object.flip_normals_operator"
+    bl_label = "Flip Normals"
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+ 
+    def execute(self, context):
+        props = context.scene.curve_slice_pro_properties
+        if props.visualization_obj_name in context.scene.objects:
+            vis_obj = context.scene.objects[props.visualization_obj_name]
+            if vis_obj.type == 'MESH':
+                # Reverse the face winding on the mesh itself; selection and active object stay as they are
+                flip_mesh_normals(vis_obj.data)
+                # A tracked preview must rewrite its loops on the next refresh
+                if _preview_state.get("object_name") == vis_obj.name:
+                    _preview_state.pop("loops", None)
+        return {'FINISHED'}
+
+class ToggleNormalsOperator(bpy.types.Operator):
+    bl_idname = "object.toggle_normals_operator"
+    bl_label = "Toggle Normals"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        props = context.scene.curve_slice_pro_properties
+        new_state = not props.flip_normals
+
+        # The update callback rewinds the preview's faces
+        props.flip_normals = new_state
+        props.temp_override = not new_state
+        self.report({'INFO'}, f"Flip Normals set to {props.flip_normals}")
+
+        return {'FINISHED'}
+
+
+class CurveSliceProProperties(bpy.types.PropertyGroup):
+    # Rewrite the live preview in place when a cutter setting changes
+    def update_preview(self, context):
+        refresh_preview(context)
+
+    # Tessellation settings change the outline itself, so the source is read again
+    def update_preview_source(self, context):
+        reload_preview_source(context)
+
+    depth: bpy.props.FloatProperty(name="Depth", default=1.0, update=update_preview)
+    depth_offset: bpy.props.FloatProperty(name="Depth Offset", default=0.0, update=update_preview)
+    cut_mode: bpy.props.BoolProperty(name="Cut Mode", default=True)
+    cut_target: bpy.props.PointerProperty(
+        name="Cut Target",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'MESH'
+    )
+    cut_through: bpy.props.BoolProperty(name="Cut Through", default=False, update=update_preview)
+    multi_target: bpy.props.BoolProperty(
+        name="Multiple Targets",
+        description="Cut every mesh in the target collection, or every selected mesh when no collection is set",
+        default=False
+    )
+    target_collection: bpy.props.PointerProperty(name="Target Collection", type=bpy.types.Collection)
+    batch_cut: bpy.props.BoolProperty(
+        name="Cut All Selected",
+        description="Cut with every selected curve and grease pencil object using a single boolean",
+        default=False
+    )
+    # Repeat the cutter in a pattern, merged into one cutter so each target takes one boolean
+    pattern: bpy.props.EnumProperty(
+        name="Pattern",
+        items=[
+            ('NONE', "None", "Cut with the cutter once"),
+            ('ARRAY', "Array", "Repeat the cutter in a line, or in a grid with more than one row"),
+            ('RADIAL', "Radial", "Repeat the cutter around a pivot, turning about the cut direction"),
+            ('GUIDE', "Along Curve", "Spread copies of the cutter evenly along a guide curve"),
+        ],
+        default='NONE'
+    )
+    pattern_count: bpy.props.IntProperty(name="Count", default=3, min=1, soft_max=100)
+    pattern_spacing: bpy.props.FloatVectorProperty(
+        name="Spacing", description="World offset between neighbouring copies in a row",
+        size=3, default=(1.0, 0.0, 0.0), subtype='TRANSLATION'
+    )
+    pattern_rows: bpy.props.IntProperty(name="Rows", default=1, min=1, soft_max=100)
+    pattern_row_spacing: bpy.props.FloatVectorProperty(
+        name="Row Spacing", description="World offset between neighbouring rows",
+        size=3, default=(0.0, 1.0, 0.0), subtype='TRANSLATION'
+    )
+    pattern_pivot: bpy.props.PointerProperty(
+        name="Pivot", type=bpy.types.Object,
+        description="Object the radial pattern turns around; the 3D cursor when empty"
+    )
+    pattern_angle: bpy.props.FloatProperty(
+        name="Angle", description="Angle the radial copies are spread over",
+        default=2 * np.pi, min=-2 * np.pi, max=2 * np.pi, subtype='ANGLE'
+    )
+    pattern_guide: bpy.props.PointerProperty(
+        name="Guide", type=bpy.types.Object,
+        description="Curve or grease pencil object the copies are spread along",
+        poll=lambda self, obj: obj.type in {'CURVE', 'GPENCIL'}
+    )
+    skip_missing_instances: bpy.props.BoolProperty(
+        name="Skip Missing Copies",
+        description="Leave out pattern copies whose bounds miss every target",
+        default=True
+    )
+
+    # Properties for Setting Custom Resolution
+    tessellation: bpy.props.EnumProperty(
+        name="Tessellation",
+        items=[
+            ('RESOLUTION', "Resolution", "Sample curves at their own preview resolution"),
+            ('ADAPTIVE', "Adaptive", "Sample curves by curvature, within the chord tolerance"),
+        ],
+        default='RESOLUTION',
+        update=update_preview_source
+    )
+    chord_tolerance: bpy.props.FloatProperty(
+        name="Chord Tolerance",
+        description="Largest distance between the curve and the straight edges sampling it",
+        default=0.001,
+        min=0.000001,
+        soft_max=0.1,
+        precision=4,
+        update=update_preview_source
+    )
+    decimate_spline: bpy.props.BoolProperty(name="Decimate Spline Before Cut", default=False, update=update_preview)
+    simplify_tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest distance the simplified outline may deviate from the curve",
+        default=0.01,
+        min=0.0,
+        soft_max=1.0,
+        precision=4,
+        update=update_preview
+    )
+    simplify_units: bpy.props.EnumProperty(
+        name="Units",
+        items=[
+            ('WORLD', "World", "Tolerance in scene units"),
+            ('SCREEN', "Screen", "Tolerance in pixels of the view the cut is projected from"),
+        ],
+        default='WORLD',
+        update=update_preview
+    )
+
+    # Memory budget for generated cutter meshes kept around for reuse
+    cutter_cache_mb: bpy.props.IntProperty(
+        name="Cutter Cache (MB)",
+        description="Memory kept for reusing cutter meshes built with identical settings",
+        default=256,
+        min=0
+    )
+
+    # Per-stage timings of the last operator runs
+    profile_cuts: bpy.props.BoolProperty(
+        name="Profile Cuts",
+        description="Record the time, element counts and Python memory peak of every stage of a cut",
+        default=False
+    )
+    profile_history: bpy.props.IntProperty(name="Runs Kept", default=5, min=1, max=50)
+    profile_log_path: bpy.props.StringProperty(
+        name="Log File",
+        description="Append every profiled run to this file as one JSON line",
+        subtype='FILE_PATH'
+    )
+    show_profile: bpy.props.BoolProperty(name="Profiling", default=False)
+
+    # Properties for Setting Custom Thickness
+    set_thickness: bpy.props.BoolProperty(name="Set Thickness", default=False, update=update_preview)
+    watertight: bpy.props.BoolProperty(
+        name="Watertight Cutter",
+        description="Cap the cutter into a closed solid, closing open curves with a straight edge",
+        default=True,
+        update=update_preview
+    )
+    solver_strategy: bpy.props.EnumProperty(
+        name="Solver",
+        items=[
+            ('EXACT', "Exact", "Always use the Exact boolean solver"),
+            ('FAST', "Fast", "Use the Fast solver whenever the cutter is a closed, consistently wound solid"),
+            ('AUTO', "Auto", "Use the Fast solver on large closed targets, and cut again with Exact "
+                             "when its result fails validation"),
+        ],
+        default='EXACT'
+    )
+    non_destructive: bpy.props.BoolProperty(
+        name="Non-Destructive",
+        description="Stack cutters on a boolean modifier of each target instead of applying them; bake them later",
+        default=False
+    )
+    background_cuts: bpy.props.BoolProperty(
+        name="Cut in Background",
+        description="Run the cut target by target from a timer, with progress and cancel, as one undo step",
+        default=False
+    )
+    localized_cut: bpy.props.BoolProperty(
+        name="Localized Cut",
+        description="Cut only the faces near the cutter and weld them back, for dense targets",
+        default=False
+    )
+    thickness: bpy.props.FloatProperty(name="Thickness", default=0.0, min=0.0, max=10.0, update=update_preview)
+    flip_normals: bpy.props.BoolProperty(name="Flip Normals", default=False)
+    keep_curve_post_cut: bpy.props.BoolProperty(name="Keep Curve Post Cut", default=False)
+    projection: bpy.props.EnumProperty(
+        name="Projection",
+        items=[
+            ('ORTHOGRAPHIC', "Orthographic", "Extrude the outline straight along the view direction"),
+            ('PERSPECTIVE', "Perspective", "Extrude the outline along rays from the eye of a perspective view"),
+        ],
+        default='ORTHOGRAPHIC',
+        update=update_preview
+    )
+    view_rot: bpy.props.FloatVectorProperty(size=4)  # Quaternion rotation
+    view_matrix: bpy.props.FloatVectorProperty(size=16)  # World to view matrix, rows in order
+    projection_matrix: bpy.props.FloatVectorProperty(size=16)  # View to clip matrix, rows in order
+    pixel_size: bpy.props.FloatProperty()  # World size of a screen pixel when view_rot was stored
+    original_active_object_name: bpy.props.StringProperty()
+    visualization_obj_name: bpy.props.StringProperty()
+
+    # define the new attribute
+    temp_override: bpy.props.BoolProperty(name="Temp Override", default=False)
+
+    # The update function for the flip_normals property
+    def update_flip_normals(self, context):
+        # A tracked preview only needs its face winding rewritten
+        if flip_preview(context) or refresh_preview(context):
+            return
+        preview = context.scene.objects.get(self.visualization_obj_name) if self.visualization_obj_name else None
+        if preview is not None and preview.type == 'MESH':
+            flip_mesh_normals(preview.data)
+
+    flip_normals: bpy.props.BoolProperty(name="Flip Normals", default=False, update=update_flip_normals)
+
+
+class VisualizationOperator(bpy.types.Operator):
+    bl_idname = "object.visualization_operator"
+    bl_label = "Visualize Normals"
+    bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR'}
+
+    def invoke(self, context, event):
+        with profile_run(context, "Visualize"):
+            return self.visualize(context)
+
+    def visualize(self, context):
+        props = context.scene.curve_slice_pro_properties
+        view_layer = context.view_layer
+        original_active_object_name = view_layer.objects.active.name if view_layer.objects.active else None
+        
+        # Check if there is an active object and it is selected
+        if context.active_object is None or not context.active_object.select_get():
+            self.report({'WARNING'}, "No object selected.")
+            return {'CANCELLED'}
+        
+        # Check if there is an active object and it is selected
+        if props.cut_mode and not cut_targets(context, props):
+            self.report({'WARNING'}, "No cut target selected. Please select a target to cut.")
+            return {'CANCELLED'}
+
+        # Keep a live preview that already follows this curve and only rewrite its mesh
+        source_obj = context.active_object
+        preview = context.scene.objects.get(props.visualization_obj_name)
+        if (preview is not None and source_obj.type in {'CURVE', 'GPENCIL'}
+                and _preview_state.get("source_name") == source_obj.name):
+            capture_view(context, props, source_obj)
+            direction = view_direction(props.view_rot)
+            with profiling.stage("read_curve") as record:
+                polyline = read_curve_polyline(context, source_obj, props)
+                record.update(verts_out=len(polyline[0]), faces_out=len(polyline[2]))
+            track_preview(preview, source_obj, polyline, cutter_local_direction(source_obj, direction),
+                          object_scale(source_obj))
+            preview.matrix_world = source_obj.matrix_world.copy()
+            with profiling.stage("refresh_preview") as record:
+                refresh_preview(context)
+                record.update(verts_out=len(preview.data.vertices), faces_out=len(preview.data.polygons))
+            show_face_orientation(context, True)
+            return {'FINISHED'}
+
+        # Remove the existing visualization object if it exists
+        if props.visualization_obj_name in context.scene.objects:
+            remove_object_and_data(context.scene.objects[props.visualization_obj_name])
+            props.visualization_obj_name = ""
+
+        if not props.visualization_obj_name or props.visualization_obj_name not in context.scene.objects:
+            # Only update view_rot to current view rotation if visualization_obj_name does not exist or does not refer to an existing object
+            capture_view(context, props, context.active_object)
+
+        # Calculate the extrusion direction from view_rot
+        direction = view_direction(props.view_rot)
+        view_layer = context.view_layer
+
+        # Store the original active object (the curve or grease pencil)
+        original_active_object = context.active_object
+        props.original_active_object_name = original_active_object.name  # Store the name.
+
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        if props.visualization_obj_name:
+            vis_obj = context.scene.objects.get(props.visualization_obj_name)
+            if vis_obj is not None:  # Ensure object exists before trying to unlink and delete
+                remove_object_and_data(vis_obj)
+                props.visualization_obj = ""
+
+        if context.active_object is None or (context.active_object.type != 'CURVE' and context.active_object.type != 'GPENCIL'):
+            self.report({'WARNING'}, "No active curve object for visualization.")
+            return {'CANCELLED'}
+        
+        source_obj = context.active_object
+
+        # Ensure we are in object mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        with profiling.stage("read_curve") as record:
+            polyline = read_curve_polyline(context, source_obj, props)
+            record.update(verts_out=len(polyline[0]), faces_out=len(polyline[2]))
+        local_direction = cutter_local_direction(source_obj, direction)
+        stats = {}
+        visualization_obj = build_cutter_object(context, source_obj, props, direction, name="Visualizer",
+                                                polyline=polyline, stats=stats, eye=view_eye(props))
+        report_simplification(self, stats)
+        props.visualization_obj_name = visualization_obj.name
+        track_preview(visualization_obj, source_obj, polyline, local_direction, object_scale(source_obj))
+
+        # Set the overlay mode to display the face orientation
+        show_face_orientation(context, True)
+
+        # Reselect the original_active_object and set it as the active object again
+        view_layer.objects.active = original_active_object
+        original_active_object.select_set(True)
+
+        # Update the context
+        context.view_layer.update()
+
+        # Trigger redraw
+        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+
+        if original_active_object_name in context.view_layer.objects:
+            context.view_layer.objects.active = context.view_layer.objects[original_active_object_name]
+            context.view_layer.objects.active.select_set(True)
+
+        return {'FINISHED'}
+
+
+    def execute(self, context):
+        props = context.scene.curve_slice_pro_properties
+        original_obj_name = props.original_active_object_name
+        viz_obj_name = props.visualization_obj_name
+
+        if props.flip_normals and viz_obj_name in context.scene.objects:
+            viz_obj = context.scene.objects[viz_obj_name]
+
+            # A tracked preview has its winding brought in line; others are flipped in place
+            if not (flip_preview(context) or refresh_preview(context)) and viz_obj.type == 'MESH':
+                flip_mesh_normals(viz_obj.data)
+
+        # Check if there is an active object and it is selected
+        if context.active_object is None or not context.active_object.select_get():
+            self.report({'WARNING'}, "No object selected.")
+            return {'CANCELLED'}
+        
+        # Check if there is an active object and it is selected
+        if props.cut_mode and not cut_targets(context, props):
+            self.report({'WARNING'}, "No cut target selected. Please select a target to cut.")
+            return {'CANCELLED'}
+
+        if original_obj_name in context.scene.objects:
+            original_obj = context.scene.objects[original_obj_name]
+            # Select and activate the original object
+            context.view_layer.objects.active = original_obj
+            original_obj.select_set(True)
+
+        return {'FINISHED'}
+
+
+#Define the set active operator class
+class OBJECT_OT_set_active_operator(bpy.types.Operator):
+    bl_idname = "object.set_active_operator"
+    bl_label = "Set Active Object"
+    bl_options = {'INTERNAL'} 
+    
+    original_active_object_name: bpy.props.StringProperty() 
+
+    def execute(self, context):
+        original_active_object_name = self.original_active_object_name
+        if original_active_object_name in bpy.data.objects:
+            original_obj = bpy.data.objects[original_active_object_name]
+            original_obj.select_set(True)
+            context.view_layer.objects.active = original_obj
+        return {'FINISHED'}
+
+# Define the operator for the button
+class CurveSlicePro(bpy.types.Operator):
+    bl_idname = "object.simple_operator"
+    bl_label = "CurveSlice"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Store the view rotation at the time the operator is invoked
+    def invoke(self, context, event):
+        props = context.scene.curve_slice_pro_properties
+
+        # Check if there is an active object and it is selected
+        if context.active_object is None or not context.active_object.select_get():
+            self.report({'WARNING'}, "No object selected.")
+            return {'CANCELLED'}
+        
+        # Check if there is an active object and it is selected
+        if props.cut_mode and not cut_targets(context, props):
+            self.report({'WARNING'}, "No cut target selected. Please select a target to cut.")
+            return {'CANCELLED'}
+
+        # From the discussion above, we only update this if the visualization_obj_name is not set, or the visualization object doesn't exist
+        if not props.visualization_obj_name or props.visualization_obj_name not in context.scene.objects:
+            capture_view(context, props, context.active_object)
+
+        # Remove the visualization object if it exists
+        if props.visualization_obj_name:
+            remove_object_and_data(context.scene.objects[props.visualization_obj_name])
+            props.visualization_obj_name = ""
+
+
+        return self.execute(context)
+
+    def execute(self, context):
+        with profile_run(context, "CurveSlice"):
+            return self.cut(context)
+
+    def cut(self, context):
+        props = context.scene.curve_slice_pro_properties
+
+
+        # Check if there is an active object and it is selected.
+        if context.active_object is None or not context.active_object.select_get():
+            self.report({'WARNING'}, "No object selected.")
+            return {'CANCELLED'}
+        
+        # Check if cut mode is enabled, yest a cut_target is not set.
+        if props.cut_mode and not cut_targets(context, props):
+            self.report({'WARNING'}, "No cut target selected. Please select a target to cut.")
+            return {'CANCELLED'}
+        
+        
+        # Check if there is an active object and it is selected
+        if context.active_object is None or not context.active_object.select_get():
+            self.report({'WARNING'}, "No object selected.")
+            return {'CANCELLED'}
+        
+        # Batch mode cuts every selected curve at once
+        if props.cut_mode and props.batch_cut:
+            return self.execute_batch(context, props)
+
+        # Normal operation follows...
+        if context.active_object is None or (context.active_object.type != 'CURVE' and context.active_object.type != 'GPENCIL'):
+            self.report({'WARNING'}, "No active curve object for visualization.")
+            return {'CANCELLED'}
+
+        # Remove the visualization object if it exists
+        if props.visualization_obj_name:
+            remove_object_and_data(context.scene.objects[props.visualization_obj_name])
+            props.visualization_obj_name = ""
+
+        # Disable the Face Orientation visualization option.
+        show_face_orientation(context, False)
+
+        # Use the stored view rotation for the extrusion
+        direction = view_direction(props.view_rot)
+        if props.cut_mode and props.background_cuts:
+            return self.queue_cut(context, props, [context.active_object], direction)
+
+        # Build the extruded cutter straight from the curve's evaluated geometry, or from the
+        # grease pencil strokes.
+        stats = {}
+        extruded_object = build_cutter_object(context, context.active_object, props, direction, stats=stats,
+                                              eye=view_eye(props))
+        report_simplification(self, stats)
+        if props.cut_mode and props.pattern != 'NONE':
+            extruded_object = pattern_cutter(context, props, extruded_object, direction, self.report)
+        duplicated_object = extruded_object
+
+        # Apply the cutter to every target if "Cut Mode" is checked
+        if props.cut_mode:
+            stacked = apply_cutter(context, props, extruded_object, self.report)
+
+            # Optionally, delete the extruded curve after the boolean operation if "Keep Curve Post Cut" isn't checked
+            if stacked:
+                # The cutter now lives in the targets' cut stacks until they are baked
+                forget_cutter_mesh(duplicated_object.data)
+            elif not props.keep_curve_post_cut:
+                remove_object_and_data(duplicated_object)
+            else:
+                # A kept cutter may be edited by hand, so its mesh must leave the cache
+                forget_cutter_mesh(duplicated_object.data)
+        else:
+            # Without Cut Mode the cutter stays in the scene, where it may be edited by hand too
+            forget_cutter_mesh(duplicated_object.data)
+
+        return {'FINISHED'}
+
+    def execute_batch(self, context, props):
+        sources = [obj for obj in context.selected_objects
+                   if obj.type in {'CURVE', 'GPENCIL'}]
+        if not sources:
+            self.report({'WARNING'}, "No curve or grease pencil objects selected.")
+            return {'CANCELLED'}
+
+        # Remove the visualization object if it exists
+        if props.visualization_obj_name in context.scene.objects:
+            remove_object_and_data(context.scene.objects[props.visualization_obj_name])
+            props.visualization_obj_name = ""
+
+        show_face_orientation(context, False)
+        direction = view_direction(props.view_rot)
+        if props.background_cuts:
+            return self.queue_cut(context, props, sources, direction)
+
+        # Build every cutter first; a failing curve is reported and skipped
+        cutters = []
+        failures = []
+        total_stats = {"points_in": 0, "points_out": 0, "fill_kept": 0}
+        for source in sources:
+            stats = {}
+            try:
+                cutters.append(build_cutter_object(context, source, props, direction, stats=stats,
+                                                   eye=view_eye(props)))
+            except Exception as exc:
+                failures.append(f"{source.name}: {exc}")
+            for key in total_stats:
+                total_stats[key] += stats.get(key, 0)
+        report_simplification(self, total_stats)
+
+        for failure in failures:
+            self.report({'WARNING'}, f"Skipped {failure}")
+        if not cutters:
+            self.report({'ERROR'}, "No cutter could be built from the selection.")
+            return {'CANCELLED'}
+
+        # One merged cutter means one boolean solve on the target
+        with profiling.stage("merge_cutters") as record:
+            cutter = merge_cutter_objects(context, cutters, name="Batch Cutter")
+            record.update(verts_out=len(cutter.data.vertices), faces_out=len(cutter.data.polygons))
+        if props.pattern != 'NONE':
+            cutter = pattern_cutter(context, props, cutter, direction, self.report)
+        stacked = apply_cutter(context, props, cutter, self.report)
+
+        if not stacked and not props.keep_curve_post_cut:
+            remove_object_and_data(cutter)
+
+        self.report({'INFO'}, f"Cut {len(cutters)} of {len(sources)} objects with a single boolean.")
+        return {'FINISHED'}
+
+    # Hand the cut over to the background job runner; the results form their own undo step
+    def queue_cut(self, context, props, sources, direction):
+        if _cut_job:
+            self.report({'WARNING'}, "A background cut is already running.")
+            return {'CANCELLED'}
+        start_cut_job(context, props, sources, direction, view_eye(props))
+        self.report({'INFO'}, f"Cutting with {len(sources)} object(s) in the background.")
+        return {'FINISHED'}
+
+
+# Apply every stacked cut and remove the cutters
+class BakeCutsOperator(bpy.types.Operator):
+    bl_idname = "object.bake_cuts_operator"
+    bl_label = "Bake Cuts"
+    bl_description = "Apply the stacked cuts of every target in one boolean each and remove their cutters"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and bpy.data.collections.get(CUT_STACK_COLLECTION) is not None
+
+    def execute(self, context):
+        targets = [obj for obj in context.scene.objects
+                   if obj.type == 'MESH' and CUT_STACK_MODIFIER in obj.modifiers]
+        baked = 0
+        for target in targets:
+            if target.data.users > 1:
+                self.report({'WARNING'}, f"Skipped {target.name}: its mesh is shared with other objects.")
+                continue
+            modifier = target.modifiers[CUT_STACK_MODIFIER]
+            stack = modifier.collection
+            with context.temp_override(object=target, active_object=target):
+                bpy.ops.object.modifier_apply(modifier=modifier.name)
+            forget_target_bvh(target)
+            if stack is not None:
+                remove_cut_stack(stack)
+            baked += 1
+
+        parent = bpy.data.collections.get(CUT_STACK_COLLECTION)
+        if parent is not None and not parent.children:
+            bpy.data.collections.remove(parent)
+        self.report({'INFO'}, f"Baked the cuts of {baked} target(s).")
+        return {'FINISHED'}
+
+
+# Stop the running background cut
+class CancelCutJobOperator(bpy.types.Operator):
+    bl_idname = "object.cancel_curveslice_job"
+    bl_label = "Cancel Cut"
+    bl_description = "Stop the background cut after the current step; targets already cut stay cut"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_cut_job)
+
+    def execute(self, context):
+        cancel_cut_job()
+        return {'FINISHED'}
+
+
+# Reclaim the meshes the addon left behind and report how much was freed
+class PurgeCurveSliceDataOperator(bpy.types.Operator):
+    bl_idname = "object.purge_curveslice_data"
+    bl_label = "Purge CurveSlice Data"
+    bl_description = "Remove the preview, empty the cutter cache and delete unused cutter meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        props = context.scene.curve_slice_pro_properties
+        show_face_orientation(context, False)
+        removed, freed = purge_curveslice_data(context, props)
+        kept = sum(1 for mesh in bpy.data.meshes if mesh.get(CREATED_PROP))
+        self.report({'INFO'}, f"Removed {removed} mesh(es), freed {freed / 2 ** 20:.1f} MB; "
+                              f"{kept} cutter mesh(es) still in use.")
+        return {'FINISHED'}
+
+
+# Apply one already built cutter to every target it reaches, reporting through an operator's
+# report method. In non-destructive mode it is stacked on them instead; returns whether it was.
+def apply_cutter(context, props, cutter, report):
+    hits, solver = cutter_hits(context, props, cutter, report)
+    if props.non_destructive and hits:
+        with profiling.stage("stack_cutter", targets_out=len(hits)):
+            for target in hits:
+                assign_cut_materials(target, cutter)
+            stack_cutter(context, hits, cutter, stack_solver(hits, solver))
+        return True
+
+    # A stable order, with the active object and selection left untouched, keeps
+    # each apply from tagging anything but its own target for re-evaluation
+    for target in hits:
+        cut_target(context, props, target, cutter, solver, report)
+    return False
+
+
+# The targets a cutter reaches, in a stable order, and the boolean solver to cut them with:
+# 'AUTO' leaves the choice to each target's cut.
+def cutter_hits(context, props, cutter, report):
+    targets = [target for target in cut_targets(context, props) if target != cutter]
+    with profiling.stage("prefilter", targets_in=len(targets)) as record:
+        cutter_bounds = mesh_world_bounds(cutter)
+        hits = [target for target in targets if bounds_overlap(world_bounds(target), cutter_bounds)]
+        hits = [target for target in hits if cutter_reaches(context, target, cutter)]
+        record["targets_out"] = len(hits)
+
+    solver = 'EXACT'
+    if props.solver_strategy != 'EXACT' and hits:
+        verts, sizes, loops = read_mesh_arrays(cutter.data)
+        if cutter.get(OVERLAP_PROP):
+            report({'INFO'}, "Cutter copies overlap; using the Exact solver.")
+        elif not is_closed_manifold(sizes, loops):
+            report({'INFO'}, "Cutter is not a closed solid; using the Exact solver.")
+        elif signed_volume(verts, sizes, loops) <= 0:
+            report({'INFO'}, "Cutter is inside out; using the Exact solver.")
+        else:
+            solver = props.solver_strategy
+
+    if len(hits) < len(targets):
+        report({'INFO'}, f"Skipped {len(targets) - len(hits)} target(s) the cutter does not reach.")
+    return sorted(hits, key=lambda obj: obj.name), solver
+
+
+# Cut one target with a cutter, unless its mesh is shared. Returns whether it was cut.
+def cut_target(context, props, target, cutter, solver, report):
+    if target.data.users > 1:
+        report({'WARNING'}, f"Skipped {target.name}: its mesh is shared with other objects.")
+        return False
+    with profiling.stage("materials", target=target.name):
+        assign_cut_materials(target, cutter)
+    mesh = target.data
+    with profiling.stage("boolean", target=target.name, solver=solver, strategy=props.solver_strategy,
+                         verts_in=len(mesh.vertices), faces_in=len(mesh.polygons)) as record:
+        validate = solver == 'AUTO'
+        if validate:
+            solver = pick_auto_solver(props, target, cutter, record)
+        if validate and solver == 'FAST':
+            validated_fast_cut(context, target, cutter, record, report)
+            record["localized"] = False
+        else:
+            localized = props.localized_cut and apply_localized_cut(context, target, cutter)
+            if localized:
+                record["solver"] = 'EXACT'
+            else:
+                apply_boolean_cut(context, target, cutter, solver)
+            record["localized"] = localized
+        record.update(verts_out=len(target.data.vertices), faces_out=len(target.data.polygons))
+    forget_target_bvh(target)
+    return True
+
+
+# Targets smaller than this many faces (with the cutter) are cut with Exact by AUTO: Fast
+# saves little time on them
+AUTO_FAST_MIN_FACES = 2000
+
+
+# The solver AUTO picks for one target. Fast needs both meshes closed; a localized cut works
+# on an open piece of the target, so it always gets Exact.
+def auto_solver(cutter_faces, target_faces, target_closed, localized=False):
+    if localized or not target_closed or cutter_faces + target_faces < AUTO_FAST_MIN_FACES:
+        return 'EXACT'
+    return 'FAST'
+
+
+# The solver for a stack of cuts, which cannot be validated: AUTO stacks Fast only on
+# targets that are all closed.
+def stack_solver(targets, solver):
+    if solver != 'AUTO':
+        return solver
+    closed = all(is_closed_manifold(*read_mesh_arrays(target.data)[1:]) for target in targets)
+    return 'FAST' if closed else 'EXACT'
+
+
+# The solver AUTO picks for one target, noted in the profiling record with what it was
+# based on, for tuning the heuristic.
+def pick_auto_solver(props, target, cutter, record):
+    face_sizes, face_verts = read_mesh_arrays(target.data)[1:]
+    closed = is_closed_manifold(face_sizes, face_verts)
+    cutter_faces = len(cutter.data.polygons)
+    solver = auto_solver(cutter_faces, len(face_sizes), closed, props.localized_cut)
+    record.update(solver=solver, target_closed=closed, cutter_faces=cutter_faces)
+    return solver
+
+
+# Cut a closed target with Fast and check the result with validate_difference. A failed
+# result is replaced by the target's original mesh cut again with Exact. The validation
+# and the time of each solve go into the profiling record.
+def validated_fast_cut(context, target, cutter, record, report):
+    matrix = np.array(target.matrix_world, dtype=np.float64)
+    coords, face_sizes, face_verts = read_mesh_arrays(target.data)
+    before = signed_volume(transform_points(matrix, coords), face_sizes, face_verts)
+    cutter_coords, cutter_sizes, cutter_loops = read_mesh_arrays(cutter.data)
+    cutter_volume = signed_volume(transform_points(cutter.matrix_world, cutter_coords), cutter_sizes, cutter_loops)
+
+    backup = target.data.copy()
+    try:
+        start = time.perf_counter()
+        apply_boolean_cut(context, target, cutter, 'FAST')
+        record["fast_seconds"] = time.perf_counter() - start
+        after_coords, after_sizes, after_loops = read_mesh_arrays(target.data)
+        failure = validate_difference(before, (transform_points(matrix, after_coords), after_sizes, after_loops),
+                                      cutter_volume)
+        record["validation"] = failure or "ok"
+        if failure is None:
+            return
+
+        report({'INFO'}, f"{target.name}: the Fast result failed validation ({failure}); cutting with Exact.")
+        restore_mesh(target.data, backup)
+        start = time.perf_counter()
+        apply_boolean_cut(context, target, cutter, 'EXACT')
+        record.update(solver='EXACT', fallback=True, exact_seconds=time.perf_counter() - start)
+    finally:
+        bpy.data.meshes.remove(backup)
+
+
+# The whole CurveSlicePro cut for one curve or grease pencil source and a world space
+# extrusion direction, with no 3D view involved, for scripts and batch jobs. Only the
+# direction's orientation counts; its length is ignored. The cutter is removed afterwards
+# unless it was stacked or Keep Curve Post Cut is set.
+def cut_headless(context, source, direction, report):
+    props = context.scene.curve_slice_pro_properties
+    direction = np.asarray(direction, dtype=np.float64)
+    length = np.linalg.norm(direction)
+    if length == 0:
+        raise ValueError("cut direction has no length")
+    direction = direction / length
+    cutter = build_cutter_object(context, source, props, direction)
+    if props.pattern != 'NONE':
+        cutter = pattern_cutter(context, props, cutter, direction, report)
+    stacked = apply_cutter(context, props, cutter, report)
+    if stacked or props.keep_curve_post_cut:
+        forget_cutter_mesh(cutter.data)
+    else:
+        remove_object_and_data(cutter)
+
+
+# The background cut being run, or empty. Its units of work run one per timer tick so the
+# UI stays responsive between them; a unit returning False is still waiting for the
+# geometry thread and is tried again on the next tick.
+_cut_job = {}
+
+# Messages of the last background cut, for the panel
+_cut_job_messages = []
+
+# Seconds between two units of a background cut
+CUT_JOB_INTERVAL = 0.01
+
+# Cutter settings read by cutter_geometry, copied for the geometry thread, which must not
+# touch Blender data
+CUTTER_SETTINGS = ("flip_normals", "set_thickness", "thickness", "watertight", "decimate_spline",
+                   "simplify_tolerance", "simplify_units", "pixel_size")
+
+_geometry_pool = None
+
+
+# Thread pool building the pure NumPy cutter geometry of background cuts.
+def geometry_pool():
+    global _geometry_pool
+    if _geometry_pool is None:
+        _geometry_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="CurveSlice")
+    return _geometry_pool
+
+
+def shutdown_geometry_pool():
+    global _geometry_pool
+    if _geometry_pool is not None:
+        _geometry_pool.shutdown(wait=False, cancel_futures=True)
+        _geometry_pool = None
+
+
+# Queue a cut of every target with the cutters of sources (merged into one when there are
+# several). Everything read from Blender data is read here; the geometry is built on the
+# worker threads and the cutters, booleans and cleanup run from the timer.
+def start_cut_job(context, props, sources, direction, eye=None):
+    settings = SimpleNamespace(**{name: getattr(props, name) for name in CUTTER_SETTINGS})
+    job = {
+        "units": deque(),
+        "done": 0,
+        "total": 0,
+        "direction": direction,
+        "cutters": [],
+        "cutter": None,
+        "cut": 0,
+        "stacked": False,
+        "cancelled": False,
+        "futures": [],
+        "messages": [],
+    }
+    job["report"] = lambda _level, message: job["messages"].append(message)
+
+    for source in sources:
+        inputs = cutter_inputs(context, source, props, direction, eye=eye)
+        future = None
+        if cached_cutter_mesh(inputs["key"]) is None:
+            future = geometry_pool().submit(cutter_geometry, inputs["polyline"], inputs["direction"], settings,
+                                            inputs["depths"], inputs["scale"], None, inputs["eye"])
+            job["futures"].append(future)
+        job["units"].append(partial(build_job_cutter, source.name, inputs, future))
+    job["units"].append(prepare_job_cuts)
+    job["total"] = len(job["units"]) + 1
+
+    _cut_job.clear()
+    _cut_job.update(job)
+    _cut_job_messages.clear()
+    bpy.app.timers.register(run_cut_job, first_interval=CUT_JOB_INTERVAL)
+
+
+# Unit: turn one source's finished geometry into a cutter object.
+def build_job_cutter(source_name, inputs, future, context, props, job):
+    if future is not None and not future.done():
+        return False
+    source = bpy.data.objects.get(source_name)
+    if source is None:
+        job["report"]({'WARNING'}, f"Skipped {source_name}: it was removed.")
+        return True
+    try:
+        geometry = future.result() if future is not None else None
+    except Exception as exc:
+        job["report"]({'WARNING'}, f"Skipped {source_name}: {exc}")
+        return True
+    job["cutters"].append(cutter_object(context, source, props, inputs, geometry=geometry).name)
+    return True
+
+
+# Unit: merge the cutters, lay out a pattern and queue one unit per target they reach.
+def prepare_job_cuts(context, props, job):
+    cutters = [bpy.data.objects[name] for name in job["cutters"] if name in bpy.data.objects]
+    if not cutters:
+        job["report"]({'ERROR'}, "No cutter could be built.")
+        job["units"].append(finish_cut_job)
+        job["total"] = job["done"] + len(job["units"])
+        return True
+
+    cutter = cutters[0] if len(cutters) == 1 else merge_cutter_objects(context, cutters, name="Batch Cutter")
+    if props.pattern != 'NONE':
+        cutter = pattern_cutter(context, props, cutter, job["direction"], job["report"])
+    job["cutter"] = cutter.name
+
+    hits, solver = cutter_hits(context, props, cutter, job["report"])
+    if props.non_destructive and hits:
+        job["units"].append(partial(stack_job_cutter, [target.name for target in hits], solver))
+    else:
+        for target in hits:
+            job["units"].append(partial(cut_job_target, target.name, solver))
+    job["units"].append(finish_cut_job)
+    job["total"] = job["done"] + len(job["units"])
+    return True
+
+
+# Unit: stack the cutter on the targets it reaches.
+def stack_job_cutter(target_names, solver, context, props, job):
+    cutter = bpy.data.objects.get(job["cutter"])
+    targets = [bpy.data.objects[name] for name in target_names if name in bpy.data.objects]
+    if cutter is not None and targets:
+        for target in targets:
+            assign_cut_materials(target, cutter)
+        stack_cutter(context, targets, cutter, stack_solver(targets, solver))
+        job["stacked"] = True
+        job["cut"] = len(targets)
+    return True
+
+
+# Unit: one boolean on one target.
+def cut_job_target(target_name, solver, context, props, job):
+    cutter = bpy.data.objects.get(job["cutter"])
+    target = bpy.data.objects.get(target_name)
+    if cutter is not None and target is not None:
+        job["cut"] += cut_target(context, props, target, cutter, solver, job["report"])
+    return True
+
+
+# Last unit, also run on cancel: remove the cutters unless they are kept or stacked, and
+# record the whole cut as one undo step.
+def finish_cut_job(context, props, job):
+    for name in {*job["cutters"], job["cutter"]} - {None}:
+        cutter = bpy.data.objects.get(name)
+        if cutter is None:
+            continue
+        if job["stacked"] or props.keep_curve_post_cut:
+            forget_cutter_mesh(cutter.data)
+        else:
+            remove_object_and_data(cutter)
+
+    outcome = "Stacked the cutter on" if job["stacked"] else "Cut"
+    if job["cancelled"]:
+        outcome = "Cancelled after cutting"
+    job["report"]({'INFO'}, f"{outcome} {job['cut']} target(s).")
+    window = next(iter(context.window_manager.windows), None)
+    if window is not None:
+        with context.temp_override(window=window):
+            bpy.ops.ed.undo_push(message="CurveSlice Cut")
+    return True
+
+
+# Timer callback running the next unit of the background cut.
+def run_cut_job():
+    job = _cut_job
+    if not job:
+        return None
+    context = bpy.context
+    props = context.scene.curve_slice_pro_properties
+
+    if job["cancelled"] and job["units"] and job["units"][0] is not finish_cut_job:
+        for future in job["futures"]:
+            future.cancel()
+        job["units"].clear()
+        job["units"].append(finish_cut_job)
+
+    unit = job["units"][0]
+    try:
+        if unit(context, props, job) is False:
+            return CUT_JOB_INTERVAL
+    except Exception as exc:
+        job["report"]({'ERROR'}, f"{type(exc).__name__}: {exc}")
+    job["units"].popleft()
+    job["done"] += 1
+    redraw_view3d(context)
+
+    if job["units"]:
+        return CUT_JOB_INTERVAL
+    _cut_job_messages[:] = job["messages"]
+    _cut_job.clear()
+    redraw_view3d(context)
+    return None
+
+
+# Stop the background cut after the unit in progress; what was cut so far is kept.
+def cancel_cut_job():
+    if _cut_job:
+        _cut_job["cancelled"] = True
+
+
+def redraw_view3d(context):
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+# Show or hide face orientation in the 3D view the operator runs in, if there is one.
+def show_face_orientation(context, show):
+    space = context.space_data
+    if space is not None and space.type == 'VIEW_3D':
+        space.overlay.show_face_orientation = show
+
+
+# Record the stages of an operator call when profiling is enabled, tagged with the addon
+# and Blender versions so logged runs can be compared across releases.
+def profile_run(context, operator):
+    props = context.scene.curve_slice_pro_properties
+    info = {
+        "addon_version": ".".join(map(str, bl_info["version"])),
+        "blender_version": bpy.app.version_string,
+        "file": bpy.data.filepath,
+    }
+    log_path = bpy.path.abspath(props.profile_log_path) if props.profile_log_path else ""
+    return profiling.profile_run(operator, props.profile_cuts, props.profile_history, log_path, info)
+
+
+# Margin added on both ends of a cut through prism, relative to the length it spans
+CUT_THROUGH_MARGIN = 0.01
+
+
+# Depth and offset used for the cutter prism. Cut through spans the combined world bounds
+# of the cut targets along the cut direction (or each point's perspective ray), from every
+# point of the outline; without targets (or without an outline) it falls back to a fixed,
+# oversized prism.
+def cutter_depths(context, props, polyline=None, matrix_world=None, local_direction=None, local_eye=None):
+    if not (props.cut_mode and props.cut_through):
+        return props.depth, props.depth_offset
+
+    targets = cut_targets(context, props)
+    if not targets or polyline is None or len(polyline[0]) == 0:
+        return 20000, 10000
+    bounds = [world_bounds(target) for target in targets]
+    bounds = (np.min([low for low, _ in bounds], axis=0), np.max([high for _, high in bounds], axis=0))
+
+    matrix = np.array(matrix_world, dtype=np.float64)
+    points = transform_points(matrix, polyline[0])
+    direction = matrix[:3, :3] @ np.asarray(local_direction, dtype=np.float64)
+    if local_eye is not None:
+        direction = perspective_rays(points, transform_points(matrix, local_eye[None])[0], direction)
+    span = np.linalg.norm(bounds[1] - bounds[0]) + np.ptp(points, axis=0).max()
+    return through_depths(points, direction, bounds, span * CUT_THROUGH_MARGIN + 0.0001)
+
+
+# Read the evaluated (tessellated) geometry of a curve or mesh object into NumPy arrays.
+def read_evaluated_polyline(context, obj):
+    depsgraph = context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", face_sizes)
+        face_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", face_verts)
+    finally:
+        eval_obj.to_mesh_clear()
+    return coords.reshape(-1, 3).astype(np.float64), edges.reshape(-1, 2), face_sizes, face_verts
+
+
+# Whether a curve's outline is fully described by its splines, with nothing added on evaluation.
+def supports_adaptive_tessellation(obj):
+    curve = obj.data
+    return (obj.mode != 'EDIT' and not obj.modifiers and curve.shape_keys is None
+            and curve.bevel_depth == 0 and curve.extrude == 0 and curve.offset == 0
+            and curve.bevel_object is None and (curve.dimensions == '3D' or curve.fill_mode == 'NONE'))
+
+
+# Read the control points and handles of all Bezier splines and tessellate them adaptively.
+def read_bezier_polyline(curve, tolerance):
+    splines = curve.splines
+    sizes = np.array([len(spline.bezier_points) for spline in splines], dtype=np.int64)
+    cyclic = np.array([spline.use_cyclic_u for spline in splines], dtype=bool)
+    total = int(sizes.sum())
+
+    arrays = []
+    for attribute in ("co", "handle_left", "handle_right"):
+        values = np.empty(total * 3, dtype=np.float32)
+        start = 0
+        for spline, size in zip(splines, sizes):
+            spline.bezier_points.foreach_get(attribute, values[start * 3:(start + size) * 3])
+            start += size
+        arrays.append(values.reshape(-1, 3).astype(np.float64))
+    return tessellate_bezier(*arrays, sizes, cyclic, tolerance)
+
+
+# The stroke points of every visible grease pencil layer at the current frame, as one
+# polyline: each stroke is a chain of consecutive vertices, closed when it is cyclic.
+def read_gpencil_polyline(obj):
+    chunks = []
+    sizes = []
+    cyclic = []
+    for layer in obj.data.layers:
+        frame = layer.active_frame
+        if layer.hide or frame is None:
+            continue
+        matrix = np.array(layer.matrix_layer, dtype=np.float64)
+        for stroke in frame.strokes:
+            count = len(stroke.points)
+            if count < 2:
+                continue
+            coords = np.empty(count * 3, dtype=np.float32)
+            stroke.points.foreach_get("co", coords)
+            chunks.append(transform_points(matrix, coords.reshape(-1, 3).astype(np.float64)))
+            sizes.append(count)
+            cyclic.append(stroke.use_cyclic and count > 2)
+
+    empty = np.zeros(0, dtype=np.int32)
+    if not chunks:
+        return np.zeros((0, 3)), np.zeros((0, 2), dtype=np.int32), empty, empty
+    coords = np.concatenate(chunks)
+    sizes = np.array(sizes, dtype=np.int64)
+    ends = np.cumsum(sizes) - 1
+    starts = ends - sizes + 1
+
+    # Every point but a stroke's last is joined to the next; cyclic strokes close the loop
+    first = np.arange(len(coords) - 1)
+    first = first[~np.isin(first, ends)]
+    closing = np.column_stack((ends, starts))[np.array(cyclic)]
+    edges = np.concatenate((np.column_stack((first, first + 1)), closing)).astype(np.int32)
+    return coords, edges, empty, empty
+
+
+# The cutter outline of a curve, grease pencil or mesh object. With adaptive tessellation,
+# plain Bezier curves are sampled by chord error instead of resolution_u; other curves and
+# grease pencil strokes keep their points, thinned to the same chord error.
+def read_curve_polyline(context, obj, props=None):
+    adaptive = props is not None and props.tessellation == 'ADAPTIVE'
+    if obj.type == 'GPENCIL':
+        polyline = read_gpencil_polyline(obj)
+        return simplify_polyline(polyline, props.chord_tolerance / object_scale(obj)) if adaptive else polyline
+    if not adaptive or obj.type != 'CURVE':
+        return read_evaluated_polyline(context, obj)
+
+    tolerance = props.chord_tolerance / object_scale(obj)
+    if supports_adaptive_tessellation(obj) and all(spline.type == 'BEZIER' for spline in obj.data.splines):
+        return read_bezier_polyline(obj.data, tolerance)
+    return simplify_polyline(read_evaluated_polyline(context, obj), tolerance)
+
+
+# Write vertices and a flat (sizes, loops) face list into an empty mesh datablock.
+def write_mesh(mesh, verts, face_sizes, face_verts):
+    mesh.clear_geometry()
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.loops.add(len(face_verts))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(face_verts, dtype=np.int32))
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set("loop_start", face_starts(face_sizes).astype(np.int32))
+    mesh.update(calc_edges=True)
+
+
+# Reverse the winding of every face of a mesh datablock in bulk, without edit mode.
+def flip_mesh_normals(mesh):
+    face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", face_sizes)
+    face_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", face_verts)
+    # The mesh no longer matches the cutter it was cached as
+    forget_cutter_mesh(mesh)
+    mesh.loops.foreach_set("vertex_index", reverse_face_winding(face_sizes, face_verts).astype(np.int32))
+    mesh.update(calc_edges=True)
+
+
+# The cutter's extrusion direction in the local space of its source object.
+def cutter_local_direction(source, direction):
+    return to_local_direction(np.array(source.matrix_world), direction)
+
+
+# World position of the stored view's eye for perspective cuts, or None for orthographic
+# cuts and views that have no eye.
+def view_eye(props):
+    if props.projection != 'PERSPECTIVE':
+        return None
+    return perspective_eye(props.view_matrix, props.projection_matrix)
+
+
+# A world space eye position in the local space of the cutter's source object.
+def cutter_local_eye(source, eye):
+    if eye is None:
+        return None
+    return transform_points(np.linalg.inv(np.array(source.matrix_world)), np.asarray(eye)[None])[0]
+
+
+# Mean scale of an object, to turn world space tolerances into its local space.
+def object_scale(obj):
+    return float(np.mean(np.abs(obj.matrix_world.to_scale()))) or 1.0
+
+
+# Simplification tolerance in the local space of an object with the given mean scale.
+def simplify_tolerance(props, scale=1.0):
+    if not props.decimate_spline:
+        return None
+    tolerance = props.simplify_tolerance
+    if props.simplify_units == 'SCREEN':
+        tolerance *= props.pixel_size
+    return tolerance / scale
+
+
+# Store the current view rotation and matrices and the world size of one screen pixel at obj.
+def capture_view(context, props, obj):
+    region_3d = context.space_data.region_3d
+    props.view_rot = list(region_3d.view_rotation)
+    props.view_matrix = [value for row in region_3d.view_matrix for value in row]
+    props.projection_matrix = [value for row in region_3d.window_matrix for value in row]
+    props.pixel_size = 0.0
+
+    # The operator may run from the sidebar, so measure in the area's main region
+    region = next((region for region in context.area.regions if region.type == 'WINDOW'), None)
+    if region is None:
+        return
+    location = obj.matrix_world.translation
+    screen = view3d_utils.location_3d_to_region_2d(region, region_3d, location)
+    if screen is None:
+        return
+    a = view3d_utils.region_2d_to_location_3d(region, region_3d, screen, location)
+    b = view3d_utils.region_2d_to_location_3d(region, region_3d, screen + Vector((1, 0)), location)
+    props.pixel_size = (b - a).length
+
+
+def report_simplification(operator, stats):
+    points_in = stats.get("points_in", 0)
+    points_out = stats.get("points_out", 0)
+    if points_in and points_out < points_in:
+        operator.report({'INFO'}, f"Simplified the cutter outline from {points_in} to {points_out} points "
+                                  f"({points_out / points_in:.1%} kept).")
+    if stats.get("fill_kept"):
+        operator.report({'INFO'}, "Filled outlines whose fill is not a flat cap of their outline "
+                                  "were not simplified.")
+
+
+# Thickness of the cutter shell, or None for a plain prism.
+def cutter_thickness(props):
+    return props.thickness if props.set_thickness else None
+
+
+# The simplified and capped outline a cutter for a polyline read by read_curve_polyline is
+# extruded from.
+def cutter_geometry_outline(polyline, local_direction, props, scale=1.0, stats=None):
+    return cutter_outline(polyline, local_direction, cutter_thickness(props), simplify_tolerance(props, scale),
+                          props.watertight, stats)
+
+
+# Vertices and faces of the cutter for a polyline read by read_curve_polyline. An outline
+# from cutter_geometry_outline for the same polyline and settings skips rebuilding it.
+def cutter_geometry(polyline, local_direction, props, depths, scale=1.0, stats=None, local_eye=None, outline=None):
+    if outline is None:
+        outline = cutter_geometry_outline(polyline, local_direction, props, scale, stats)
+    depth, depth_offset = depths
+    return extrude_cutter(outline, local_direction, depth, depth_offset, props.flip_normals,
+                          cutter_thickness(props), local_eye)
+
+
+# Cutter meshes by content key, least recently used first. Values are (mesh name, size in bytes);
+# names rather than datablocks are stored so entries survive undo.
+_cutter_cache = OrderedDict()
+
+# Custom property holding the cache key on a cached mesh
+CACHE_KEY_PROP = "curveslice_cache_key"
+
+
+# Hash of everything a cutter mesh depends on: the evaluated points, the local extrusion
+# direction (from view_rot), the local eye of a perspective cut and the cutter settings.
+def cutter_cache_key(polyline, local_direction, props, depths, scale=1.0, local_eye=None):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in polyline:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    digest.update(np.asarray(local_direction, dtype=np.float64).tobytes())
+    if local_eye is not None:
+        digest.update(b"eye" + np.asarray(local_eye, dtype=np.float64).tobytes())
+    settings = (
+        tuple(depths),
+        props.flip_normals,
+        props.set_thickness and props.thickness,
+        props.watertight,
+        simplify_tolerance(props, scale),
+    )
+    digest.update(repr(settings).encode())
+    return digest.hexdigest()
+
+
+def mesh_size_bytes(mesh):
+    return len(mesh.vertices) * 12 + len(mesh.edges) * 8 + len(mesh.loops) * 8 + len(mesh.polygons) * 4
+
+
+def cached_cutter_mesh(key):
+    entry = _cutter_cache.get(key)
+    if entry is None:
+        return None
+    mesh = bpy.data.meshes.get(entry[0])
+    if mesh is None or mesh.get(CACHE_KEY_PROP) != key:
+        del _cutter_cache[key]
+        return None
+    _cutter_cache.move_to_end(key)
+    return mesh
+
+
+# Keep a mesh under its key (a fake user keeps it alive after its object is removed),
+# then evict least recently used meshes until the cache fits the budget.
+def store_cutter_mesh(key, mesh, budget_mb):
+    previous = cached_cutter_mesh(key)
+    if previous is not None and previous != mesh:
+        release_cutter_mesh(previous)
+    mesh[CACHE_KEY_PROP] = key
+    mesh.use_fake_user = True
+    _cutter_cache[key] = (mesh.name, mesh_size_bytes(mesh))
+    _cutter_cache.move_to_end(key)
+
+    budget = budget_mb * 1024 * 1024
+    total = sum(size for _, size in _cutter_cache.values())
+    while total > budget and len(_cutter_cache) > 1:
+        oldest_key, (oldest_name, oldest_size) = next(iter(_cutter_cache.items()))
+        total -= oldest_size
+        oldest = bpy.data.meshes.get(oldest_name)
+        if oldest is not None and oldest.get(CACHE_KEY_PROP) == oldest_key:
+            release_cutter_mesh(oldest)
+        else:
+            del _cutter_cache[oldest_key]
+
+
+# Stop caching a mesh, e.g. because it is about to be edited in place.
+def forget_cutter_mesh(mesh):
+    key = mesh.pop(CACHE_KEY_PROP, None)
+    if key is None:
+        return
+    mesh.use_fake_user = False
+    if key in _cutter_cache and _cutter_cache[key][0] == mesh.name:
+        del _cutter_cache[key]
+
+
+# Drop a mesh from the cache; it is removed once nothing else uses it.
+def release_cutter_mesh(mesh):
+    forget_cutter_mesh(mesh)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+
+# Custom property marking the meshes the addon created. It is stored on the datablock itself,
+# so the registry survives undo and saving, unlike a list of names would.
+CREATED_PROP = "curveslice_created"
+
+
+def track_datablock(datablock):
+    datablock[CREATED_PROP] = True
+    return datablock
+
+
+# Meshes the addon created that nothing keeps alive. Call it after the cache has forgotten
+# its meshes, which clears the addon's own fake users; a fake user left on a mesh was set by
+# the user to keep it.
+def orphaned_meshes():
+    return [mesh for mesh in bpy.data.meshes if mesh.get(CREATED_PROP) and mesh.users == 0]
+
+
+# Remove the preview, empty the cutter cache and delete every mesh the addon created that no
+# object uses any more. Kept and stacked cutters stay. Returns (meshes removed, bytes freed).
+def purge_curveslice_data(context, props):
+    preview = context.scene.objects.get(props.visualization_obj_name) if props.visualization_obj_name else None
+    if preview is not None:
+        remove_object_and_data(preview)
+    props.visualization_obj_name = ""
+    _preview_state.clear()
+
+    for name, _ in list(_cutter_cache.values()):
+        mesh = bpy.data.meshes.get(name)
+        if mesh is not None:
+            forget_cutter_mesh(mesh)
+    _cutter_cache.clear()
+    _target_bvh_cache.clear()
+
+    orphans = orphaned_meshes()
+    freed = sum(mesh_size_bytes(mesh) for mesh in orphans)
+    for mesh in orphans:
+        bpy.data.meshes.remove(mesh)
+    return len(orphans), freed
+
+
+# A loaded file starts with empty caches, so cutter meshes it saved with the cache's fake
+# user have nothing left to reuse them; once that fake user is cleared, reclaim them along
+# with any other orphans of the addon. Meshes the user shielded with a fake user stay.
+@persistent
+def reclaim_on_load(_filepath):
+    _cut_job.clear()
+    _cut_job_messages.clear()
+    _cutter_cache.clear()
+    _preview_state.clear()
+    _target_bvh_cache.clear()
+    for mesh in bpy.data.meshes:
+        if mesh.get(CACHE_KEY_PROP) is not None:
+            forget_cutter_mesh(mesh)
+    for mesh in orphaned_meshes():
+        bpy.data.meshes.remove(mesh)
+
+
+# Everything a source's cutter geometry is built from, read on the main thread: the outline,
+# the local extrusion direction and eye, the object scale, the depths and the cache key.
+def cutter_inputs(context, source, props, direction, polyline=None, eye=None):
+    if polyline is None:
+        with profiling.stage("read_curve") as record:
+            polyline = read_curve_polyline(context, source, props)
+            record.update(verts_out=len(polyline[0]), faces_out=len(polyline[2]))
+    local_direction = cutter_local_direction(source, direction)
+    local_eye = cutter_local_eye(source, eye)
+    scale = object_scale(source)
+    depths = cutter_depths(context, props, polyline, source.matrix_world, local_direction, local_eye)
+    return {
+        "polyline": polyline,
+        "direction": local_direction,
+        "eye": local_eye,
+        "scale": scale,
+        "depths": depths,
+        "key": cutter_cache_key(polyline, local_direction, props, depths, scale, local_eye),
+    }
+
+
+# Build the cutter prism for a curve without going through operators or edit mode, or the
+# frustum of a perspective cut when a world space eye is given.
+# Identical inputs reuse the cached mesh instead of building it again.
+def build_cutter_object(context, source, props, direction, name="Cutter", polyline=None, stats=None,
+                        eye=None):
+    inputs = cutter_inputs(context, source, props, direction, polyline, eye)
+    return cutter_object(context, source, props, inputs, name, stats=stats)
+
+
+# The cutter object for inputs from cutter_inputs, from the cache, from geometry already
+# built (verts, sizes, loops), or built here.
+def cutter_object(context, source, props, inputs, name="Cutter", geometry=None, stats=None):
+    mesh = cached_cutter_mesh(inputs["key"])
+    if mesh is None:
+        if geometry is None:
+            with profiling.stage("build_geometry", verts_in=len(inputs["polyline"][0])) as record:
+                geometry = cutter_geometry(inputs["polyline"], inputs["direction"], props, inputs["depths"],
+                                           inputs["scale"], stats, inputs["eye"])
+                record.update(verts_out=len(geometry[0]), faces_out=len(geometry[1]))
+        with profiling.stage("write_mesh"):
+            mesh = track_datablock(bpy.data.meshes.new(name))
+            write_mesh(mesh, *geometry)
+            store_cutter_mesh(inputs["key"], mesh, props.cutter_cache_mb)
+    elif mesh.users > 1:
+        # Still used by another object (a kept cutter or the preview), so hand out a copy
+        mesh = mesh.copy()
+        mesh.pop(CACHE_KEY_PROP, None)
+        mesh.use_fake_user = False
+
+    mesh.materials.clear()
+    for mat in getattr(source.data, "materials", ()):
+        mesh.materials.append(mat)
+
+    cutter = bpy.data.objects.new(name, mesh)
+    cutter.matrix_world = source.matrix_world.copy()
+    collections = source.users_collection or (context.collection,)
+    for collection in collections:
+        collection.objects.link(cutter)
+    return cutter
+
+
+# State behind the live preview: the polyline it was built from, so setting changes only
+# rewrite the preview mesh instead of rebuilding it from the curve.
+_preview_state = {}
+
+# Seconds without further edits to the source curve before the preview is rebuilt
+PREVIEW_REBUILD_DELAY = 0.2
+
+
+def polyline_key(polyline):
+    coords, edges, face_sizes, face_verts = polyline
+    return hash((coords.tobytes(), edges.tobytes(), face_sizes.tobytes(), face_verts.tobytes()))
+
+
+# Remember what the preview was built from; source is None when it cannot be followed live.
+def track_preview(preview, source, polyline, local_direction, scale=1.0):
+    if _preview_state.get("object_name") != preview.name:
+        _preview_state.clear()
+    _preview_state.update(
+        object_name=preview.name,
+        source_name=source.name if source is not None else "",
+        polyline=polyline,
+        direction=local_direction,
+        scale=scale,
+        geometry_key=polyline_key(polyline),
+    )
+
+
+# The preview's simplified and capped outline, kept until the polyline, the local direction
+# or a setting it depends on changes, so that depth, offset and winding changes only
+# extrude it again.
+def preview_outline(props):
+    thickness = cutter_thickness(props)
+    key = (_preview_state["geometry_key"], tuple(np.asarray(_preview_state["direction"], dtype=np.float64)),
+           simplify_tolerance(props, _preview_state["scale"]), props.watertight and thickness is None)
+    if _preview_state.get("outline_key") != key:
+        outline = cutter_geometry_outline(_preview_state["polyline"], _preview_state["direction"], props,
+                                          _preview_state["scale"])
+        _preview_state.update(outline=outline, outline_key=key)
+    return _preview_state["outline"]
+
+
+# Rewrite the preview mesh for the current settings. Vertex positions (and face winding)
+# are updated in place whenever the topology is unchanged. Returns False if there is no
+# tracked preview.
+def refresh_preview(context):
+    props = context.scene.curve_slice_pro_properties
+    preview = context.scene.objects.get(props.visualization_obj_name)
+    if preview is None or _preview_state.get("object_name") != preview.name:
+        return False
+
+    local_eye = cutter_local_eye(preview, view_eye(props))
+    depths = cutter_depths(context, props, _preview_state["polyline"], preview.matrix_world,
+                           _preview_state["direction"], local_eye)
+    verts, sizes, loops = cutter_geometry(_preview_state["polyline"], _preview_state["direction"], props,
+                                          depths, _preview_state["scale"], local_eye=local_eye,
+                                          outline=preview_outline(props))
+    mesh = preview.data
+    forget_cutter_mesh(mesh)
+    previous_sizes = _preview_state.get("sizes")
+    if (previous_sizes is not None and len(verts) == len(mesh.vertices)
+            and len(loops) == len(mesh.loops) and np.array_equal(sizes, previous_sizes)):
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+        if np.array_equal(loops, _preview_state.get("loops")):
+            mesh.update()
+        else:
+            mesh.loops.foreach_set("vertex_index", loops)
+            mesh.update(calc_edges=True)
+    else:
+        write_mesh(mesh, verts, sizes, loops)
+
+    _preview_state.update(sizes=sizes, loops=loops, depths=depths, local_eye=local_eye,
+                          flipped=props.flip_normals)
+    store_preview_mesh(props, mesh)
+    return True
+
+
+# The rewritten preview is exactly the cutter for the current settings, so a cut can reuse it.
+def store_preview_mesh(props, mesh):
+    key = cutter_cache_key(_preview_state["polyline"], _preview_state["direction"], props,
+                           _preview_state["depths"], _preview_state["scale"], _preview_state["local_eye"])
+    store_cutter_mesh(key, mesh, props.cutter_cache_mb)
+
+
+# Bring the tracked preview's face winding in line with Flip Normals. Only the winding of an
+# open cutter depends on it, so its loops are reversed in place instead of rebuilding the
+# cutter. Returns False if there is no tracked preview whose loops are known.
+def flip_preview(context):
+    props = context.scene.curve_slice_pro_properties
+    preview = context.scene.objects.get(props.visualization_obj_name)
+    if (preview is None or _preview_state.get("object_name") != preview.name
+            or _preview_state.get("loops") is None or len(preview.data.loops) != len(_preview_state["loops"])):
+        return False
+
+    mesh = preview.data
+    forget_cutter_mesh(mesh)
+    if (_preview_state["flipped"] != props.flip_normals
+            and is_flippable(preview_outline(props), cutter_thickness(props))):
+        loops = reverse_face_winding(_preview_state["sizes"], _preview_state["loops"])
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.update(calc_edges=True)
+        _preview_state["loops"] = loops
+    _preview_state["flipped"] = props.flip_normals
+    store_preview_mesh(props, mesh)
+    return True
+
+
+# Timer callback: rebuild the preview once the source curve has stopped changing.
+def rebuild_preview_from_source():
+    wait = _preview_state.get("changed_at", 0.0) + PREVIEW_REBUILD_DELAY - time.monotonic()
+    if wait > 0:
+        return wait
+
+    context = bpy.context
+    source = context.scene.objects.get(_preview_state.get("source_name", ""))
+    if source is None:
+        return None
+    polyline = read_curve_polyline(context, source, context.scene.curve_slice_pro_properties)
+    key = polyline_key(polyline)
+    if key != _preview_state.get("geometry_key"):
+        _preview_state.update(polyline=polyline, geometry_key=key)
+        refresh_preview(context)
+    return None
+
+
+# Read the tracked preview's source curve again, after settings that change its tessellation.
+def reload_preview_source(context):
+    source = context.scene.objects.get(_preview_state.get("source_name", ""))
+    if source is None:
+        return False
+    polyline = read_curve_polyline(context, source, context.scene.curve_slice_pro_properties)
+    _preview_state.update(polyline=polyline, geometry_key=polyline_key(polyline))
+    return refresh_preview(context)
+
+
+# Watch the preview's source curve and schedule a debounced rebuild when its geometry changes.
+@persistent
+def preview_depsgraph_update(scene, depsgraph):
+    source_name = _preview_state.get("source_name")
+    if not source_name:
+        return
+    for update in depsgraph.updates:
+        if (update.is_updated_geometry and isinstance(update.id, bpy.types.Object)
+                and update.id.name == source_name):
+            _preview_state["changed_at"] = time.monotonic()
+            if not bpy.app.timers.is_registered(rebuild_preview_from_source):
+                bpy.app.timers.register(rebuild_preview_from_source, first_interval=PREVIEW_REBUILD_DELAY)
+            break
+
+
+# Remove an object together with its (now unused) data block.
+def remove_object_and_data(obj):
+    data = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if data is not None and data.users == 0:
+        if isinstance(data, bpy.types.Mesh):
+            bpy.data.meshes.remove(data)
+        elif isinstance(data, bpy.types.Curve):
+            bpy.data.curves.remove(data)
+
+
+# Read a mesh's vertices and faces into NumPy arrays.
+def read_mesh_arrays(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", face_sizes)
+    face_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", face_verts)
+    return coords.reshape(-1, 3).astype(np.float64), face_sizes, face_verts
+
+
+# Custom property set on a merged cutter whose parts may overlap. Every part is closed, so
+# the merged mesh still passes is_closed_manifold, but it intersects itself, which the Fast
+# solver does not support.
+OVERLAP_PROP = "curveslice_overlapping"
+
+
+# Merge several cutter objects into one world-space cutter and remove the originals.
+def merge_cutter_objects(context, cutters, name="Cutter"):
+    vert_chunks = []
+    size_chunks = []
+    loop_chunks = []
+    boxes = []
+    vert_offset = 0
+    for cutter in cutters:
+        coords, face_sizes, face_verts = read_mesh_arrays(cutter.data)
+        coords = transform_points(cutter.matrix_world, coords)
+        vert_chunks.append(coords)
+        size_chunks.append(face_sizes)
+        loop_chunks.append(face_verts + vert_offset)
+        if len(coords):
+            boxes.append((coords.min(axis=0), coords.max(axis=0)))
+        vert_offset += len(coords)
+
+    mesh = track_datablock(bpy.data.meshes.new(name))
+    write_mesh(mesh, np.concatenate(vert_chunks), np.concatenate(size_chunks), np.concatenate(loop_chunks))
+    merged = bpy.data.objects.new(name, mesh)
+    context.collection.objects.link(merged)
+    if boxes and boxes_overlap_any(np.array(boxes)):
+        merged[OVERLAP_PROP] = True
+
+    for cutter in cutters:
+        remove_object_and_data(cutter)
+    return merged
+
+
+# World matrices placing the copies of a pattern, or None without a pattern.
+def pattern_matrices(context, props, direction):
+    if props.pattern == 'ARRAY':
+        return grid_pattern(props.pattern_count, props.pattern_spacing, props.pattern_rows,
+                            props.pattern_row_spacing)
+    if props.pattern == 'RADIAL':
+        pivot = props.pattern_pivot.matrix_world.translation if props.pattern_pivot else context.scene.cursor.location
+        return radial_pattern(props.pattern_count, np.array(pivot), direction, props.pattern_angle)
+    if props.pattern == 'GUIDE' and props.pattern_guide is not None:
+        coords, edges = read_curve_polyline(context, props.pattern_guide)[:2]
+        return guide_pattern(transform_points(props.pattern_guide.matrix_world, coords), edges,
+                             props.pattern_count)
+    return None
+
+
+# Replace a cutter by one world space mesh holding a copy of it per pattern instance, so
+# the whole pattern costs each target a single boolean. Copies whose bounds miss every
+# target are left out first; the original placement is kept if nothing is left. A pattern
+# whose copies overlap is marked with OVERLAP_PROP, so it is never cut with Fast.
+def pattern_cutter(context, props, cutter, direction, report):
+    matrices = pattern_matrices(context, props, direction)
+    if matrices is None:
+        return cutter
+
+    with profiling.stage("pattern", instances_in=len(matrices)) as record:
+        coords, face_sizes, face_verts = read_mesh_arrays(cutter.data)
+        coords = transform_points(cutter.matrix_world, coords)
+        if props.skip_missing_instances and len(coords):
+            bounds = (coords.min(axis=0), coords.max(axis=0))
+            targets = [world_bounds(target) for target in cut_targets(context, props) if target != cutter]
+            keep = instances_overlapping(bounds, matrices, targets)
+            keep[0] |= not keep.any()
+            if not keep.all():
+                report({'INFO'}, f"Left out {len(keep) - keep.sum()} pattern copies that miss every target.")
+            matrices = matrices[keep]
+
+        verts, sizes, loops = replicate_mesh(coords, face_sizes, face_verts, matrices)
+        mesh = track_datablock(bpy.data.meshes.new("Pattern Cutter"))
+        write_mesh(mesh, verts, sizes, loops)
+        for mat in cutter.data.materials:
+            mesh.materials.append(mat)
+        merged = bpy.data.objects.new(mesh.name, mesh)
+        # Copies closer than the cutter's size intersect each other
+        overlapping = bool(cutter.get(OVERLAP_PROP))
+        if len(coords) and not overlapping:
+            overlapping = boxes_overlap_any(instance_bounds((coords.min(axis=0), coords.max(axis=0)), matrices))
+        if overlapping:
+            merged[OVERLAP_PROP] = True
+        record["overlapping"] = overlapping
+        for collection in cutter.users_collection or (context.collection,):
+            collection.objects.link(merged)
+        remove_object_and_data(cutter)
+        record.update(instances_out=len(matrices), verts_out=len(verts), faces_out=len(sizes))
+    return merged
+
+
+# Give the target its Original material and the cutter the CutSurface material.
+def assign_cut_materials(target_object, extruded_object):
+    # Check if the Original material exists
+    if "Original" not in bpy.data.materials:
+        # Create the Original material
+        original_mat = bpy.data.materials.new(name="Original")
+        original_mat.diffuse_color = (0.1, 0.1, 0.8, 1)  # Define this material color as silvery blue
+    else:
+        # Use the existing Original material
+        original_mat = bpy.data.materials["Original"]
+
+    # Assign the Original material to the boolean object if it has no materials
+    if len(target_object.data.materials) == 0:
+        # Add a new material slot
+        target_object.data.materials.append(None)
+
+        # Add the original material to the new material slot
+        target_object.material_slots[0].material = original_mat
+
+    # Check if the CutSurface material exists
+    if "CutSurface" not in bpy.data.materials:
+        # Create the CutSurface material
+        cutsurface_mat = bpy.data.materials.new(name="CutSurface")
+        cutsurface_mat.diffuse_color = (1, 0.1, 0.1, 1)  # Define this material color as red
+    else:
+        # Use the existing CutSurface material
+        cutsurface_mat = bpy.data.materials["CutSurface"]
+
+    # Assign the CutSurface material to the extruded object
+    # Check if the object has any material slots
+    if not extruded_object.material_slots:
+        # If no material slots are found, add one
+        extruded_object.data.materials.append(None)
+        if len(target_object.data.materials) == 0:
+            # No materials, just add CutSurface
+            extruded_object.data.materials.append(cutsurface_mat)
+        else:
+            # Replace first material with CutSurface
+            extruded_object.material_slots[0].material = cutsurface_mat
+
+
+# Add a difference boolean modifier to the target and apply it.
+def apply_boolean_cut(context, target_object, extruded_object, solver='EXACT', hole_tolerant=False):
+    boolean_modifier = target_object.modifiers.new(name="Cut Modifier", type='BOOLEAN')
+    boolean_modifier.operation = 'DIFFERENCE'
+    boolean_modifier.solver = solver
+    if solver == 'EXACT':
+        boolean_modifier.use_hole_tolerant = hole_tolerant
+    boolean_modifier.object = extruded_object
+    boolean_modifier.material_mode = 'TRANSFER'
+
+    # Apply the boolean modifier
+    with context.temp_override(object=target_object, active_object=target_object):
+        bpy.ops.object.modifier_apply(modifier=boolean_modifier.name)
+
+
+# Faces in the flat layout as the per-face index lists BVHTree.FromPolygons takes.
+def polygon_lists(face_sizes, face_verts):
+    return [face.tolist() for face in np.split(face_verts, face_starts(face_sizes)[1:])]
+
+
+# BVH trees of cut targets in their local space, by object name, least recently used first.
+# Entries are dropped when the object's geometry changes.
+_target_bvh_cache = OrderedDict()
+
+# Number of target BVH trees kept
+TARGET_BVH_CACHE_SIZE = 8
+
+
+def target_bvh(context, target):
+    entry = _target_bvh_cache.get(target.name)
+    key = (target.data.name, len(target.data.vertices), len(target.data.polygons))
+    if entry is not None and entry[0] == key:
+        _target_bvh_cache.move_to_end(target.name)
+        return entry[1]
+
+    tree = BVHTree.FromObject(target, context.evaluated_depsgraph_get())
+    _target_bvh_cache[target.name] = (key, tree)
+    while len(_target_bvh_cache) > TARGET_BVH_CACHE_SIZE:
+        _target_bvh_cache.popitem(last=False)
+    return tree
+
+
+def forget_target_bvh(target):
+    _target_bvh_cache.pop(target.name, None)
+
+
+# Drop the BVH trees of targets whose geometry changed.
+@persistent
+def target_bvh_depsgraph_update(scene, depsgraph):
+    if not _target_bvh_cache:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            _target_bvh_cache.pop(update.id.name, None)
+
+
+# Whether a point lies inside the closed surface of a BVH tree, by the parity of the
+# surface crossings along a ray. The ray is skewed so it rarely grazes edges.
+def point_inside(tree, point, limit=1000):
+    direction = Vector((0.5773, 0.5774, 0.5773))
+    origin = Vector(point)
+    for crossings in range(limit):
+        location = tree.ray_cast(origin, direction)[0]
+        if location is None:
+            return crossings % 2 == 1
+        origin = location + direction * 1e-6
+    return False
+
+
+# Whether applying the cutter would change the target: its surface crosses the target's,
+# it lies inside the target (a cavity) or the target lies inside it.
+def cutter_reaches(context, target, cutter):
+    coords, face_sizes, face_verts = read_mesh_arrays(cutter.data)
+    if len(face_sizes) == 0 or len(target.data.vertices) == 0:
+        return False
+    to_target = np.array(target.matrix_world.inverted() @ cutter.matrix_world)
+    coords = transform_points(to_target, coords)
+    tree = target_bvh(context, target)
+    cutter_tree = BVHTree.FromPolygons(coords.tolist(), polygon_lists(face_sizes, face_verts))
+    if tree.overlap(cutter_tree):
+        return True
+    return point_inside(tree, coords[0]) or point_inside(cutter_tree, target.data.vertices[0].co)
+
+
+# Rings of neighbouring faces added around the faces a localized cut touches, so the
+# boolean never reaches the seam where the cut region is welded back
+LOCAL_CUT_RINGS = 1
+
+# Share of the target's faces above which a localized cut saves nothing
+LOCAL_CUT_MAX_SHARE = 0.5
+
+
+# Target faces the cutter reaches: faces whose surface intersects the cutter's and faces
+# lying inside it. BVH trees are only built for the faces within the cutter's bounds.
+def cut_region_faces(target, cutter, coords, face_sizes, face_verts):
+    region = np.zeros(len(face_sizes), dtype=bool)
+    cutter_coords, cutter_sizes, cutter_loops = read_mesh_arrays(cutter.data)
+    to_target = np.array(target.matrix_world.inverted() @ cutter.matrix_world)
+    cutter_coords = transform_points(to_target, cutter_coords)
+    bounds = (cutter_coords.min(axis=0), cutter_coords.max(axis=0))
+    candidates = np.flatnonzero(faces_in_bounds(coords, face_sizes, face_verts, bounds))
+    if len(candidates) == 0:
+        return region
+
+    sizes, loops = face_subset(face_sizes, face_verts, candidates)
+    used, loops = np.unique(loops, return_inverse=True)
+    target_tree = BVHTree.FromPolygons(coords[used].tolist(), polygon_lists(sizes, loops))
+    cutter_tree = BVHTree.FromPolygons(cutter_coords.tolist(), polygon_lists(cutter_sizes, cutter_loops))
+    crossing = np.zeros(len(candidates), dtype=bool)
+    crossing[[index for index, _ in target_tree.overlap(cutter_tree)]] = True
+
+    # The rest are inside when their first vertex is behind the nearest cutter face
+    orientation = np.sign(signed_volume(cutter_coords, cutter_sizes, cutter_loops))
+    inside = np.zeros(len(candidates), dtype=bool)
+    if orientation:
+        firsts = coords[used[loops[face_starts(sizes)]]]
+        for index in np.flatnonzero(~crossing):
+            location, normal, _, _ = cutter_tree.find_nearest(firsts[index])
+            if location is not None:
+                inside[index] = orientation * (Vector(firsts[index]) - location).dot(normal) < 0
+    region[candidates[crossing | inside]] = True
+    return region
+
+
+# Cut only the faces of the target near the cutter: they are copied into a temporary object,
+# cut there and welded back in place of the originals, so the boolean scales with the cut
+# region instead of the whole mesh. The copied region is open, so it is always cut by the
+# Exact solver running hole tolerant; if a target that was closed does not come out closed,
+# the mesh is restored. Returns False when the whole target has to be cut instead, which
+# includes a cutter that touches no face, as it may still lie inside the target.
+def apply_localized_cut(context, target, cutter):
+    mesh = target.data
+    if mesh.shape_keys is not None:
+        return False
+    coords, face_sizes, face_verts = read_mesh_arrays(mesh)
+    region = cut_region_faces(target, cutter, coords, face_sizes, face_verts)
+    if not region.any():
+        return False
+    region = grow_face_region(face_sizes, face_verts, region, len(coords), LOCAL_CUT_RINGS)
+    if region.mean() > LOCAL_CUT_MAX_SHARE:
+        return False
+    was_closed = is_closed_manifold(face_sizes, face_verts)
+
+    # Vertices on the seam are shared between the region and the rest of the mesh
+    region_loops = np.repeat(region, face_sizes)
+    in_region = np.zeros(len(coords), dtype=bool)
+    in_region[face_verts[region_loops]] = True
+    in_rest = np.zeros(len(coords), dtype=bool)
+    in_rest[face_verts[~region_loops]] = True
+    seam = np.flatnonzero(in_region & in_rest)
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+    piece_bm = bm.copy()
+    piece_bm.faces.ensure_lookup_table()
+    bmesh.ops.delete(piece_bm, geom=[piece_bm.faces[i] for i in np.flatnonzero(~region)], context='FACES')
+    piece_mesh = track_datablock(bpy.data.meshes.new(f"{mesh.name} Cut Region"))
+    piece_bm.to_mesh(piece_mesh)
+    piece_bm.free()
+    for mat in mesh.materials:
+        piece_mesh.materials.append(mat)
+
+    piece = bpy.data.objects.new(piece_mesh.name, piece_mesh)
+    piece.matrix_world = target.matrix_world.copy()
+    (target.users_collection or (context.collection,))[0].objects.link(piece)
+    backup = mesh.copy()
+    try:
+        apply_boolean_cut(context, piece, cutter, 'EXACT', hole_tolerant=True)
+
+        seam_verts = {tuple(coords[i]): bm.verts[i] for i in seam}
+        bmesh.ops.delete(bm, geom=[bm.faces[i] for i in np.flatnonzero(region)], context='FACES')
+        first_new = len(bm.verts)
+        first_new_face = len(bm.faces)
+        bm.from_mesh(piece.data)
+        bm.verts.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        # The boolean transferred the cutter's materials to the piece; give the target the
+        # ones it lacks and point the piece's faces at the target's slots
+        slot_count = len(mesh.materials)
+        slots = list(range(slot_count))
+        for mat in piece.data.materials[slot_count:]:
+            if mat not in mesh.materials[:]:
+                mesh.materials.append(mat)
+            slots.append(mesh.materials[:].index(mat))
+        if slots != list(range(len(slots))):
+            for face in bm.faces[first_new_face:]:
+                face.material_index = slots[min(face.material_index, len(slots) - 1)]
+        piece_coords = read_mesh_arrays(piece.data)[0]
+        targetmap = {}
+        for index, co in enumerate(map(tuple, piece_coords)):
+            seam_vert = seam_verts.get(co)
+            if seam_vert is not None:
+                targetmap[bm.verts[first_new + index]] = seam_vert
+        bmesh.ops.weld_verts(bm, targetmap=targetmap)
+        bm.to_mesh(mesh)
+        mesh.update()
+
+        if was_closed and not is_closed_manifold(*read_mesh_arrays(mesh)[1:]):
+            restore_mesh(mesh, backup)
+            while len(mesh.materials) > slot_count:
+                mesh.materials.pop()
+            return False
+        return True
+    finally:
+        bm.free()
+        remove_object_and_data(piece)
+        bpy.data.meshes.remove(backup)
+
+
+# Put a mesh's geometry back from a copy taken before it was cut.
+def restore_mesh(mesh, backup):
+    restore = bmesh.new()
+    restore.from_mesh(backup)
+    restore.to_mesh(mesh)
+    restore.free()
+    mesh.update()
+
+
+# Collection holding every target's cut stack, and the boolean modifier that reads a stack
+CUT_STACK_COLLECTION = "CurveSlice Cuts"
+CUT_STACK_MODIFIER = "CurveSlice Cuts"
+
+
+# The collection of cutters stacked on a target. On first use it is created together with a
+# single boolean modifier that cuts the target with the whole collection.
+def cut_stack_collection(context, target):
+    modifier = target.modifiers.get(CUT_STACK_MODIFIER)
+    if modifier is not None and modifier.collection is not None:
+        return modifier.collection
+
+    parent = bpy.data.collections.get(CUT_STACK_COLLECTION)
+    if parent is None:
+        parent = bpy.data.collections.new(CUT_STACK_COLLECTION)
+    if context.scene.collection.children.get(parent.name) is None:
+        context.scene.collection.children.link(parent)
+    stack = bpy.data.collections.new(f"{target.name} Cuts")
+    parent.children.link(stack)
+
+    if modifier is None:
+        modifier = target.modifiers.new(name=CUT_STACK_MODIFIER, type='BOOLEAN')
+        modifier.solver = 'FAST'
+    modifier.operation = 'DIFFERENCE'
+    modifier.operand_type = 'COLLECTION'
+    modifier.collection = stack
+    modifier.material_mode = 'TRANSFER'
+    return stack
+
+
+# Move a cutter into the cut stack of every target. The targets' meshes stay untouched; all
+# of a target's cuts are evaluated together by its one modifier. A stack only keeps the
+# Fast solver while every cutter added to it allowed it.
+def stack_cutter(context, targets, cutter, solver):
+    for collection in list(cutter.users_collection):
+        collection.objects.unlink(cutter)
+    for target in targets:
+        stack = cut_stack_collection(context, target)
+        stack.objects.link(cutter)
+        if solver == 'EXACT':
+            target.modifiers[CUT_STACK_MODIFIER].solver = 'EXACT'
+    cutter.display_type = 'WIRE'
+    cutter.hide_render = True
+
+
+# Remove a baked cut stack and the cutters no other stack uses.
+def remove_cut_stack(stack):
+    for cutter in list(stack.objects):
+        if len(cutter.users_collection) > 1:
+            stack.objects.unlink(cutter)
+        else:
+            remove_object_and_data(cutter)
+    bpy.data.collections.remove(stack)
+
+
+# Whether an object is a cutter in some target's cut stack.
+def in_cut_stack(obj):
+    parent = bpy.data.collections.get(CUT_STACK_COLLECTION)
+    return parent is not None and any(parent.children.get(collection.name) is not None
+                                      for collection in obj.users_collection)
+
+
+# All meshes the cutter should be applied to.
+def cut_targets(context, props):
+    if not props.multi_target:
+        return [props.cut_target] if props.cut_target else []
+
+    if props.target_collection is not None:
+        candidates = props.target_collection.all_objects
+    else:
+        candidates = context.selected_objects
+    return [obj for obj in candidates
+            if obj.type == 'MESH' and obj.name != props.visualization_obj_name and not in_cut_stack(obj)]
+
+
+# World space axis aligned bounds of an object, from its bounding box.
+def world_bounds(obj):
+    corners = transform_points(obj.matrix_world, np.array(obj.bound_box, dtype=np.float64))
+    return corners.min(axis=0), corners.max(axis=0)
+
+
+# World space bounds of a freshly built object, which has no evaluated bounding box yet.
+def mesh_world_bounds(obj):
+    coords = read_mesh_arrays(obj.data)[0]
+    if len(coords) == 0:
+        return np.zeros(3), np.zeros(3)
+    coords = transform_points(obj.matrix_world, coords)
+    return coords.min(axis=0), coords.max(axis=0)
+
+
+# Modified custom panel
+class OBJECT_PT_CustomPanel(bpy.types.Panel):
+    bl_idname = "OBJECT_PT_custom_panel"
+    bl_label = "Curve Project Panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "CurveSlice Pro"
+    bl_context = "objectmode"
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.curve_slice_pro_properties
+
+        layout.operator(CurveSlicePro.bl_idname)
+
+        # Progress of a background cut, or how the last one went
+        if _cut_job:
+            box = layout.box()
+            total = max(_cut_job["total"], 1)
+            box.progress(factor=_cut_job["done"] / total, type='BAR',
+                         text=f"Cutting: step {_cut_job['done']} of {total}")
+            box.operator(CancelCutJobOperator.bl_idname, icon='CANCEL')
+        elif _cut_job_messages:
+            box = layout.box()
+            for message in _cut_job_messages[-3:]:
+                box.label(text=message)
+
+        layout.prop(props, "depth")
+        layout.prop(props, "depth_offset")
+        layout.operator(VisualizationOperator.bl_idname)
+        # Only show button if visualization object exists
+        if props.visualization_obj_name and props.visualization_obj_name in context.scene.objects:
+            context.scene.objects[props.visualization_obj_name].select_set(False)
+
+        layout.prop(props, "flip_normals")
+        layout.prop(props, "projection")
+        layout.prop(props, "cut_mode")
+
+        if props.cut_mode:
+            layout.prop(props, "multi_target")
+            if props.multi_target:
+                layout.prop(props, "target_collection")
+            else:
+                layout.prop(props, "cut_target", text="Cut Target")
+            layout.prop(props, "keep_curve_post_cut")
+
+            # Add properties for Setting Thickness
+            row = layout.row()
+            row.prop(props, "set_thickness")
+            if props.set_thickness:
+                row.prop(props, "thickness")   
+
+            if props.cut_target or props.multi_target:
+                layout.prop(props, "cut_through")
+                layout.prop(props, "batch_cut")
+
+            row = layout.row()
+            row.prop(props, "watertight")
+            row.prop(props, "solver_strategy", text="")
+            row = layout.row()
+            row.prop(props, "localized_cut")
+            row.prop(props, "background_cuts")
+            row = layout.row()
+            row.prop(props, "non_destructive")
+            row.operator(BakeCutsOperator.bl_idname)
+
+            # Pattern of copies cut with a single boolean
+            layout.prop(props, "pattern")
+            if props.pattern != 'NONE':
+                box = layout.box()
+                box.prop(props, "pattern_count")
+                if props.pattern == 'ARRAY':
+                    box.prop(props, "pattern_spacing")
+                    box.prop(props, "pattern_rows")
+                    if props.pattern_rows > 1:
+                        box.prop(props, "pattern_row_spacing")
+                elif props.pattern == 'RADIAL':
+                    box.prop(props, "pattern_pivot")
+                    box.prop(props, "pattern_angle")
+                else:
+                    box.prop(props, "pattern_guide")
+                box.prop(props, "skip_missing_instances")
+    
+        # Add properties for sampling the curve
+        row = layout.row()
+        row.prop(props, "tessellation")
+        if props.tessellation == 'ADAPTIVE':
+            row.prop(props, "chord_tolerance")
+
+        # Add properties for decimating a spline cutter object
+        row = layout.row()
+        row.prop(props, "decimate_spline")
+        if props.decimate_spline:
+            row.prop(props, "simplify_tolerance")
+            row.prop(props, "simplify_units", text="")
+
+        row = layout.row()
+        row.prop(props, "cutter_cache_mb")
+        row.operator(PurgeCurveSliceDataOperator.bl_idname, text="Purge")
+
+        # Collapsible timings of the last runs
+        layout.prop(props, "show_profile", icon='TRIA_DOWN' if props.show_profile else 'TRIA_RIGHT', emboss=False)
+        if props.show_profile:
+            row = layout.row()
+            row.prop(props, "profile_cuts")
+            row.prop(props, "profile_history")
+            layout.prop(props, "profile_log_path")
+            for run in reversed(profiling.runs):
+                box = layout.box()
+                box.label(text=f"{run['operator']}: {run['seconds'] * 1000:.0f} ms")
+                for record in run["stages"]:
+                    box.label(text=profiling.describe_stage(record))
+
+# Register the operator, panel, and properties
+def register():
+    bpy.utils.register_class(ToggleNormalsOperator)
+    bpy.utils.register_class(VisualizationOperator)
+    bpy.utils.register_class(CurveSlicePro)
+    bpy.utils.register_class(BakeCutsOperator)
+    bpy.utils.register_class(PurgeCurveSliceDataOperator)
+    bpy.utils.register_class(CancelCutJobOperator)
+    bpy.utils.register_class(OBJECT_PT_CustomPanel)
+    bpy.utils.register_class(CurveSliceProProperties)
+    bpy.utils.register_class(OBJECT_OT_set_active_operator)
+    bpy.utils.register_class(FlipNormalsOperator)
+    bpy.types.Scene.curve_slice_pro_properties = bpy.props.PointerProperty(type=CurveSliceProProperties)
+    bpy.app.handlers.depsgraph_update_post.append(preview_depsgraph_update)
+    bpy.app.handlers.depsgraph_update_post.append(target_bvh_depsgraph_update)
+    bpy.app.handlers.load_post.append(reclaim_on_load)
+    wm = bpy.context.window_manager
+    # Background (blender -b) sessions have no addon keyconfig
+    if wm.keyconfigs.addon is not None:
+        km = wm.keyconfigs.addon.keymaps.new(name='Object Mode')
+        kmi = km.keymap_items.new(ToggleNormalsOperator.bl_idname, 'F', 'PRESS')
+
+
+def unregister():
+    bpy.utils.unregister_class(ToggleNormalsOperator)
+    bpy.utils.unregister_class(VisualizationOperator)
+    bpy.utils.unregister_class(CurveSlicePro)
+    bpy.utils.unregister_class(BakeCutsOperator)
+    bpy.utils.unregister_class(PurgeCurveSliceDataOperator)
+    bpy.utils.unregister_class(CancelCutJobOperator)
+    bpy.utils.unregister_class(OBJECT_PT_CustomPanel)
+    bpy.utils.unregister_class(CurveSliceProProperties)
+    bpy.utils.unregister_class(FlipNormalsOperator)
+    if preview_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(preview_depsgraph_update)
+    if target_bvh_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(target_bvh_depsgraph_update)
+    if reclaim_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reclaim_on_load)
+    if bpy.app.timers.is_registered(rebuild_preview_from_source):
+        bpy.app.timers.unregister(rebuild_preview_from_source)
+    if bpy.app.timers.is_registered(run_cut_job):
+        bpy.app.timers.unregister(run_cut_job)
+    _cut_job.clear()
+    _cut_job_messages.clear()
+    shutdown_geometry_pool()
+    _preview_state.clear()
+    _cutter_cache.clear()
+    _target_bvh_cache.clear()
+    profiling.runs.clear()
+    wm = bpy.context.window_manager
+    del bpy.types.Scene.curve_slice_pro_properties
+
+
+if __name__ == "__main__":
+    register()
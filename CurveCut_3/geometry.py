@@ -0,0 +1,816 @@
+# Pure NumPy geometry for CurveSlice Pro cutters. Nothing in here imports bpy, so it can be
+# profiled and benchmarked with plain CPython; the addon only reads and writes mesh arrays.
+#
+# Geometry is passed around as flat arrays: coords (N, 3) float64, edges (E, 2) int, and
+# faces as face_sizes (F,) plus face_verts (sum(face_sizes),), the same layout as
+# Mesh.polygons.loop_total and Mesh.loops.vertex_index.
+import numpy as np
+
+
+# World space extrusion direction for a view rotation quaternion (w, x, y, z): the view's -Z axis.
+def view_direction(quaternion):
+    w, x, y, z = np.asarray(quaternion, dtype=np.float64) / np.linalg.norm(quaternion)
+    direction = -np.array((2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y)))
+    return direction / np.linalg.norm(direction)
+
+
+# A world space direction expressed in the local space of an object with the given matrix.
+def to_local_direction(matrix_world, direction):
+    linear = np.asarray(matrix_world, dtype=np.float64)[:3, :3]
+    return np.linalg.pinv(linear) @ np.asarray(direction, dtype=np.float64)
+
+
+# Apply a 4x4 matrix to an (N, 3) array of coordinates.
+def transform_points(matrix, coords):
+    matrix = np.array(matrix, dtype=np.float64)
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+# Eye position of a view matrix (world to view), or None when the projection matrix is
+# orthographic and the view has no eye. Both are 4x4, or 16 values in row order.
+def perspective_eye(view_matrix, projection_matrix):
+    projection = np.asarray(projection_matrix, dtype=np.float64).reshape(4, 4)
+    view = np.asarray(view_matrix, dtype=np.float64).reshape(4, 4)
+    if np.isclose(projection[3, 3], 1.0) or np.linalg.matrix_rank(view) < 4:
+        return None
+    return np.linalg.inv(view)[:3, 3]
+
+
+# Unit rays from the eye through every point, scaled to the length of direction, so that
+# perspective rays measure depth like the orthographic direction they replace.
+def perspective_rays(coords, eye, direction):
+    rays = coords - np.asarray(eye, dtype=np.float64)
+    lengths = np.linalg.norm(rays, axis=1)
+    lengths[lengths == 0] = 1
+    return rays * (np.linalg.norm(direction) / lengths)[:, None]
+
+
+# Depth and depth offset of a prism that carries every outline point (world space) across
+# the box bounds = (min, max) along direction, plus margin at both ends. direction is one
+# vector or one per point (perspective rays). Depths are measured in units of direction's
+# length, the way the prism is extruded.
+def through_depths(points, direction, bounds, margin):
+    direction = np.asarray(direction, dtype=np.float64)
+    length = np.linalg.norm(direction, axis=-1)
+    unit = np.broadcast_to(direction / np.expand_dims(length, -1), points.shape)
+    corners = np.array(np.meshgrid(*zip(*bounds), indexing='ij')).reshape(3, -1).T
+    along = corners @ unit.T
+    outline = np.einsum("ij,ij->i", points, unit)
+    depth = ((along.max(axis=0) - outline + margin) / length).max()
+    depth_offset = ((outline - along.min(axis=0) + margin) / length).max()
+    return float(depth), float(depth_offset)
+
+
+def bounds_overlap(a, b):
+    return bool(np.all(a[0] <= b[1]) and np.all(b[0] <= a[1]))
+
+
+# Index of the first loop of every face.
+def face_starts(face_sizes):
+    starts = np.zeros(len(face_sizes), dtype=np.int64)
+    if len(face_sizes):
+        np.cumsum(face_sizes[:-1], out=starts[1:])
+    return starts
+
+
+# Index of the next loop around the same face, for every loop.
+def loop_next_index(face_sizes):
+    starts = face_starts(face_sizes)
+    next_index = np.arange(1, int(np.sum(face_sizes)) + 1)
+    next_index[starts + face_sizes - 1] = starts
+    return next_index
+
+
+# Undirected key for every (a, b) vertex pair, usable with np.unique and np.isin.
+def edge_keys(a, b, vert_count):
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    return np.minimum(a, b) * (vert_count + 1) + np.maximum(a, b)
+
+
+# Reverse the loop order of every face. This is normal flipping.
+def reverse_face_winding(face_sizes, face_verts):
+    if len(face_sizes) == 0:
+        return face_verts
+    starts = face_starts(face_sizes)
+    face_of_loop = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    loop_index = np.arange(len(face_verts))
+    reversed_index = 2 * starts[face_of_loop] + face_sizes[face_of_loop] - 1 - loop_index
+    return face_verts[reversed_index]
+
+
+# Boundary edges (used by a single face) as directed (a, b) pairs in face winding order.
+def boundary_loop_edges(face_sizes, face_verts):
+    a = face_verts.astype(np.int64)
+    b = a[loop_next_index(face_sizes)]
+    keys = edge_keys(a, b, int(a.max(initial=0)))
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    boundary = counts[inverse] == 1
+    return a[boundary], b[boundary]
+
+
+# Split a polyline into chains: runs of vertices i, i+1, ... joined by forward edges, which is
+# how Blender tessellates splines. Returns the path (vertex indices in chain order, with the
+# first vertex repeated at the end of closed chains), the chain of every path position, a
+# mask of the extra edges that are not part of any chain and the pinned vertices that
+# simplification must keep: branch points, endpoints of extra edges and fill face vertices.
+def polyline_chains(coords, edges, face_verts):
+    vert_count = len(coords)
+    a = edges[:, 0].astype(np.int64)
+    b = edges[:, 1].astype(np.int64)
+    forward = np.zeros(vert_count, dtype=bool)
+    forward[a[b == a + 1]] = True
+
+    run_start = np.ones(vert_count, dtype=bool)
+    run_start[1:] = ~forward[:-1]
+    run_of_vert = np.cumsum(run_start) - 1
+    starts = np.flatnonzero(run_start)
+    ends = np.append(starts[1:], vert_count) - 1
+
+    # A closing edge runs from the end of a run back to its start
+    closing = (b != a + 1) & (run_of_vert[a] == run_of_vert[b]) & (a == ends[run_of_vert[a]]) \
+        & (b == starts[run_of_vert[a]]) & (a - b > 1)
+    closed = np.zeros(len(starts), dtype=bool)
+    closed[run_of_vert[a[closing]]] = True
+
+    pinned = np.zeros(vert_count, dtype=bool)
+    extra = (b != a + 1) & ~closing
+    pinned[a[extra]] = True
+    pinned[b[extra]] = True
+    pinned[np.bincount(edges.ravel(), minlength=vert_count) > 2] = True
+    pinned[face_verts] = True
+
+    # Insert the repeated start after the last vertex of every closed run
+    path = np.insert(np.arange(vert_count), ends[closed] + 1, starts[closed])
+    chain = np.insert(run_of_vert, ends[closed] + 1, np.flatnonzero(closed))
+    return path, chain, extra, pinned
+
+
+# Distance from points p to the segments a-b.
+def point_segment_distance(p, a, b):
+    ab = b - a
+    length_sq = np.einsum('ij,ij->i', ab, ab)
+    t = np.einsum('ij,ij->i', p - a, ab) / np.where(length_sq > 0, length_sq, 1)
+    closest = a + ab * np.clip(t, 0, 1)[:, None]
+    return np.linalg.norm(p - closest, axis=1)
+
+
+# The outline of a filled polyline: its edges without the fill faces and the edges inside
+# the fill. None when cap_polyline could not rebuild the fill from that outline, because a
+# face vertex is not on the fill's boundary or the edges are not all closed chains.
+def fill_outline(polyline):
+    coords, edges, face_sizes, face_verts = polyline
+    vert_count = len(coords)
+    boundary_a, boundary_b = boundary_loop_edges(face_sizes, face_verts)
+    on_boundary = np.zeros(vert_count, dtype=bool)
+    on_boundary[boundary_a] = True
+    if not on_boundary[face_verts].all():
+        return None
+
+    face_keys = edge_keys(face_verts, face_verts[loop_next_index(face_sizes)], vert_count)
+    boundary_keys = edge_keys(boundary_a, boundary_b, vert_count)
+    keys = edge_keys(edges[:, 0], edges[:, 1], vert_count)
+    inner = np.isin(keys, face_keys) & ~np.isin(keys, boundary_keys)
+    missing = ~np.isin(boundary_keys, keys)
+    outline_edges = np.concatenate((edges[~inner], np.column_stack((boundary_a, boundary_b))[missing]))
+    outline_edges = outline_edges.astype(np.int32)
+
+    path, chain, extra, _ = polyline_chains(coords, outline_edges, face_verts[:0])
+    if extra.any():
+        return None
+    breaks = np.flatnonzero(np.diff(chain)) + 1
+    if not all(len(loop) < 3 or loop[0] == loop[-1] for loop in np.split(path, breaks)):
+        return None
+    return coords, outline_edges, face_sizes[:0], face_verts[:0]
+
+
+# Ramer-Douglas-Peucker simplification of every chain at once. Instead of recursing, each
+# pass finds the farthest interior point of all open segments together and splits the
+# segments that deviate by more than tolerance. When direction is given, deviation is
+# measured in the plane perpendicular to it, since depth along the cut does not change
+# the cut's shape. A fill is dropped, its outline simplified and capped again; fills that
+# cap_polyline cannot rebuild keep their vertices, and stats records fill_kept.
+def simplify_polyline(polyline, tolerance, direction=None, stats=None):
+    coords, edges, face_sizes, face_verts = polyline
+    vert_count = len(coords)
+    if stats is not None:
+        stats.update(points_in=vert_count, points_out=vert_count)
+    if tolerance <= 0 or vert_count < 3:
+        return polyline
+
+    if len(face_sizes):
+        cap_direction = direction
+        if cap_direction is None:
+            cap_direction = face_area_vectors(coords, face_sizes, face_verts).sum(axis=0)
+        outline = fill_outline(polyline)
+        if outline is not None and np.linalg.norm(cap_direction) > 0:
+            return cap_polyline(simplify_polyline(outline, tolerance, direction, stats), cap_direction)
+        if stats is not None:
+            stats["fill_kept"] = True
+
+    points = coords
+    if direction is not None:
+        direction = np.asarray(direction, dtype=np.float64)
+        direction = direction / np.linalg.norm(direction)
+        points = coords - np.outer(coords @ direction, direction)
+
+    path, chain, extra, pinned = polyline_chains(coords, edges, face_verts)
+    keep = np.zeros(len(path), dtype=bool)
+    keep[pinned[path]] = True
+    keep[0] = keep[-1] = True
+    chain_change = np.flatnonzero(chain[1:] != chain[:-1])
+    keep[chain_change] = keep[chain_change + 1] = True
+
+    # Closed chains start and end on the same vertex; anchor their middle so no segment is degenerate
+    chain_first = np.append(0, chain_change + 1)
+    chain_last = np.append(chain_change, len(path) - 1)
+    is_closed = path[chain_first] == path[chain_last]
+    keep[((chain_first + chain_last) // 2)[is_closed & (chain_last - chain_first > 1)]] = True
+
+    path_points = points[path]
+    anchors = np.flatnonzero(keep)
+    same_chain = chain[anchors[:-1]] == chain[anchors[1:]]
+    seg_start = anchors[:-1][same_chain]
+    seg_end = anchors[1:][same_chain]
+
+    while True:
+        interior = seg_end - seg_start - 1
+        active = interior > 0
+        seg_start, seg_end, interior = seg_start[active], seg_end[active], interior[active]
+        if len(seg_start) == 0:
+            break
+
+        seg_of = np.repeat(np.arange(len(seg_start)), interior)
+        offsets = face_starts(interior)
+        position = seg_start[seg_of] + 1 + np.arange(len(seg_of)) - offsets[seg_of]
+        distance = point_segment_distance(path_points[position], path_points[seg_start][seg_of],
+                                          path_points[seg_end][seg_of])
+
+        # The first interior point reaching its segment's largest distance is the split point
+        largest = np.maximum.reduceat(distance, offsets)
+        candidate = np.where(distance == largest[seg_of], np.arange(len(distance)), len(distance))
+        farthest = np.minimum.reduceat(candidate, offsets)
+        split = largest > tolerance
+        middle = position[farthest[split]]
+        keep[middle] = True
+        seg_start = np.concatenate((seg_start[split], middle))
+        seg_end = np.concatenate((middle, seg_end[split]))
+
+    keep_vert = np.zeros(vert_count, dtype=bool)
+    keep_vert[path[keep]] = True
+    remap = np.cumsum(keep_vert) - 1
+
+    # Chain edges join consecutive kept path positions; other edges only join pinned vertices
+    kept = np.flatnonzero(keep)
+    same_chain = chain[kept[:-1]] == chain[kept[1:]]
+    chain_edges = np.column_stack((path[kept[:-1]][same_chain], path[kept[1:]][same_chain]))
+    new_edges = remap[np.concatenate((chain_edges, edges[extra]))]
+
+    if stats is not None:
+        stats["points_out"] = int(keep_vert.sum())
+    return coords[keep_vert], new_edges.astype(np.int32), face_sizes, remap[face_verts].astype(np.int32)
+
+
+# Largest number of line segments a single Bezier segment is split into
+MAX_SEGMENT_SUBDIVISIONS = 1024
+
+
+# Adaptive tessellation of cubic Bezier splines, all splines at once. Every segment gets
+# its own sample count from the chord error bound of uniform subdivision,
+# max|B''| / (8 n^2) <= tolerance, where max|B''| <= 6 max(|P0 - 2 P1 + P2|, |P1 - 2 P2 + P3|).
+# Straight segments get a single edge and tight bends get as many as they need.
+# Control points and handles are concatenated over all splines, spline_sizes gives the
+# number of points per spline and cyclic which splines are closed. Returns a polyline.
+def tessellate_bezier(points, handles_left, handles_right, spline_sizes, cyclic, tolerance):
+    spline_sizes = np.asarray(spline_sizes, dtype=np.int64)
+    cyclic = np.asarray(cyclic, dtype=bool)
+    spline_count = len(spline_sizes)
+    spline_of_point = np.repeat(np.arange(spline_count), spline_sizes)
+    first_point = face_starts(spline_sizes)
+    last_point = first_point + spline_sizes - 1
+
+    # Every point starts a segment, except the last point of an open spline
+    point_index = np.arange(len(points))
+    is_last = point_index == last_point[spline_of_point]
+    seg_from = point_index[~is_last | cyclic[spline_of_point]]
+    seg_to = np.where(is_last[seg_from], first_point[spline_of_point[seg_from]], seg_from + 1)
+    spline_of_segment = spline_of_point[seg_from]
+
+    p0 = points[seg_from]
+    p1 = handles_right[seg_from]
+    p2 = handles_left[seg_to]
+    p3 = points[seg_to]
+    second = np.maximum(np.linalg.norm(p0 - 2 * p1 + p2, axis=1), np.linalg.norm(p1 - 2 * p2 + p3, axis=1))
+    counts = np.ceil(np.sqrt(3 * second / (4 * max(tolerance, 1e-12))))
+    counts = np.clip(counts, 1, MAX_SEGMENT_SUBDIVISIONS).astype(np.int64)
+
+    # Sample t = k / n for k < n on every segment; the segment end is the next segment's start
+    seg_of = np.repeat(np.arange(len(seg_from)), counts)
+    t = (np.arange(len(seg_of)) - face_starts(counts)[seg_of]) / counts[seg_of]
+    s = 1 - t
+    coords = ((s ** 3)[:, None] * p0[seg_of] + (3 * s * s * t)[:, None] * p1[seg_of]
+              + (3 * s * t * t)[:, None] * p2[seg_of] + (t ** 3)[:, None] * p3[seg_of])
+    spline_of_vert = spline_of_segment[seg_of]
+
+    # Open splines end on their last control point
+    open_splines = np.flatnonzero(~cyclic & (spline_sizes > 0))
+    samples_per_spline = np.bincount(spline_of_segment, weights=counts, minlength=spline_count).astype(np.int64)
+    insert_at = np.cumsum(samples_per_spline)[open_splines]
+    coords = np.insert(coords, insert_at, points[last_point[open_splines]], axis=0)
+    spline_of_vert = np.insert(spline_of_vert, insert_at, open_splines)
+
+    # Consecutive vertices of a spline are joined, closed splines also from their end to their start
+    vert_index = np.arange(len(coords))
+    same_spline = spline_of_vert[:-1] == spline_of_vert[1:]
+    edges = np.column_stack((vert_index[:-1][same_spline], vert_index[1:][same_spline]))
+    verts_per_spline = np.bincount(spline_of_vert, minlength=spline_count)
+    closed = np.flatnonzero(cyclic & (verts_per_spline > 1))
+    spline_first_vert = face_starts(verts_per_spline)
+    closing = np.column_stack((spline_first_vert[closed] + verts_per_spline[closed] - 1, spline_first_vert[closed]))
+    edges = np.concatenate((edges, closing)).astype(np.int32)
+
+    return coords, edges, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+
+
+# Sizes and loops of a subset of faces, given by index, in the same flat layout.
+def face_subset(face_sizes, face_verts, faces):
+    sizes = face_sizes[faces]
+    first = np.repeat(face_starts(face_sizes)[faces], sizes)
+    offset = np.arange(int(sizes.sum())) - np.repeat(face_starts(sizes), sizes)
+    return sizes, face_verts[first + offset]
+
+
+# Faces whose bounding box overlaps bounds = (min, max).
+def faces_in_bounds(coords, face_sizes, face_verts, bounds):
+    if len(face_sizes) == 0:
+        return np.zeros(0, dtype=bool)
+    corners = coords[face_verts]
+    starts = face_starts(face_sizes)
+    face_min = np.minimum.reduceat(corners, starts)
+    face_max = np.maximum.reduceat(corners, starts)
+    return np.all(face_min <= bounds[1], axis=1) & np.all(face_max >= bounds[0], axis=1)
+
+
+# Grow a face mask by rings of faces sharing a vertex with it.
+def grow_face_region(face_sizes, face_verts, region, vert_count, rings=1):
+    starts = face_starts(face_sizes)
+    for _ in range(rings):
+        marked = np.zeros(vert_count, dtype=bool)
+        marked[face_verts[np.repeat(region, face_sizes)]] = True
+        region = np.logical_or.reduceat(marked[face_verts], starts)
+    return region
+
+
+# Signed volume enclosed by faces; positive when their normals point outwards.
+def signed_volume(verts, face_sizes, face_verts):
+    if len(face_sizes) == 0:
+        return 0.0
+    area = face_area_vectors(verts, face_sizes, face_verts)
+    centers = np.add.reduceat(verts[face_verts], face_starts(face_sizes)) / face_sizes[:, None]
+    return float(np.einsum('ij,ij->', area, centers) / 6)
+
+
+# Why the result of cutting a closed target with a difference boolean is implausible, or
+# None when it is not: it must not be empty, must still be closed, and may lose no more
+# volume than the cutter has, nor gain any. Volumes are compared by magnitude, so inverted
+# windings do not matter; tolerance is relative to the larger volume.
+def validate_difference(before_volume, after, cutter_volume, tolerance=1e-4):
+    verts, face_sizes, face_verts = after
+    if len(face_sizes) == 0:
+        return "empty result"
+    if not is_closed_manifold(face_sizes, face_verts):
+        return "result is not closed"
+    removed = abs(before_volume) - abs(signed_volume(verts, face_sizes, face_verts))
+    slack = tolerance * max(abs(before_volume), abs(cutter_volume))
+    if removed < -slack:
+        return "volume grew"
+    if removed > abs(cutter_volume) + slack:
+        return "removed more volume than the cutter has"
+    return None
+
+
+# Two unit vectors spanning the plane perpendicular to direction, ordered so that a
+# counter-clockwise polygon in (u, v) has its normal along direction.
+def plane_basis(direction):
+    direction = np.asarray(direction, dtype=np.float64)
+    direction = direction / np.linalg.norm(direction)
+    axis = np.zeros(3)
+    axis[np.argmin(np.abs(direction))] = 1.0
+    u = np.cross(direction, axis)
+    u /= np.linalg.norm(u)
+    return u, np.cross(direction, u)
+
+
+# Twice the signed area of a 2D polygon; positive when counter-clockwise.
+def signed_area(points):
+    x, y = points[:, 0], points[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+# Whether 2D points lie inside a polygon, by the even-odd crossing rule.
+def points_in_polygon(points, polygon):
+    a = polygon[:, None, :]
+    b = np.roll(polygon, -1, axis=0)[:, None, :]
+    p = points[None, :, :]
+    straddles = (a[..., 1] > p[..., 1]) != (b[..., 1] > p[..., 1])
+    dy = np.where(straddles, b[..., 1] - a[..., 1], 1)
+    crossing_x = a[..., 0] + (p[..., 1] - a[..., 1]) * (b[..., 0] - a[..., 0]) / dy
+    return np.count_nonzero(straddles & (p[..., 0] < crossing_x), axis=0) % 2 == 1
+
+
+# Ear and reflex vertex pairs tested at once, to keep the test arrays small.
+EAR_TEST_CHUNK = 1 << 20
+
+
+# Triangulate a simple 2D polygon by ear clipping. Each pass tests every convex vertex
+# against the reflex vertices (only those can fall inside an ear) and clips all ears that
+# are not neighbours at once. Triangles keep the polygon's winding.
+def triangulate_polygon(points):
+    orientation = 1.0 if signed_area(points) >= 0 else -1.0
+    remaining = np.arange(len(points))
+    triangles = []
+    while len(remaining) > 3:
+        p = points[remaining]
+        prev = np.roll(p, 1, axis=0)
+        after = np.roll(p, -1, axis=0)
+        turn = orientation * ((p[:, 0] - prev[:, 0]) * (after[:, 1] - p[:, 1])
+                              - (p[:, 1] - prev[:, 1]) * (after[:, 0] - p[:, 0]))
+        candidates = np.flatnonzero(turn > 0)
+        reflex = np.flatnonzero(turn <= 0)
+
+        is_ear = np.zeros(len(remaining), dtype=bool)
+        is_ear[candidates] = ~ears_blocked(p, candidates, reflex, orientation)
+        if not is_ear.any():
+            # Degenerate input (overlaps or repeated points): clip the sharpest corner
+            is_ear[np.argmax(turn)] = True
+
+        # No two neighbouring ears are clipped in the same pass: within every run of ears,
+        # every other one is clipped
+        run_start = is_ear & ~np.roll(is_ear, 1)
+        if run_start.any():
+            order = np.roll(np.arange(len(remaining)), -np.argmax(run_start))
+            position = np.arange(len(order))
+            run_position = position - np.maximum.accumulate(np.where(run_start[order], position, 0))
+            clip = np.zeros(len(remaining), dtype=bool)
+            clip[order] = is_ear[order] & (run_position % 2 == 0)
+        else:
+            # Every vertex is an ear: take every other one, never both ends of the loop
+            clip = np.arange(len(remaining)) % 2 == 0
+            clip[-1] &= len(remaining) % 2 == 0
+        clipped = np.flatnonzero(clip)[:len(remaining) - 3]
+        triangles.append(np.column_stack((remaining[clipped - 1], remaining[clipped],
+                                          remaining[(clipped + 1) % len(remaining)])))
+        remaining = np.delete(remaining, clipped)
+    triangles.append(remaining[None, :])
+    return np.concatenate(triangles)
+
+
+# For the ear triangles at the given loop positions, whether any reflex vertex other than
+# the triangle's own corners lies inside or on the triangle. Reflex vertices are sorted by
+# x and by y, and each ear is only tested against those within its range on whichever
+# axis holds fewer of them.
+def ears_blocked(points, ears, reflex, orientation):
+    blocked = np.zeros(len(ears), dtype=bool)
+    if len(reflex) == 0 or len(ears) == 0:
+        return blocked
+    loop_length = len(points)
+    corners = np.stack((points[(ears - 1) % loop_length], points[ears], points[(ears + 1) % loop_length]))
+    orders = np.argsort(points[reflex], axis=0, kind='stable').T
+    ranges = []
+    for axis in (0, 1):
+        sorted_values = points[reflex[orders[axis]], axis]
+        ranges.append((np.searchsorted(sorted_values, corners[..., axis].min(axis=0), 'left'),
+                       np.searchsorted(sorted_values, corners[..., axis].max(axis=0), 'right')))
+    use_y = ranges[1][1] - ranges[1][0] < ranges[0][1] - ranges[0][0]
+    low = np.where(use_y, ranges[1][0], ranges[0][0])
+    counts = np.where(use_y, ranges[1][1], ranges[0][1]) - low
+    axis_of_ear = use_y.astype(np.int64)
+
+    ends = np.cumsum(counts)
+    first = 0
+    while first < len(ears):
+        last = max(int(np.searchsorted(ends, ends[first] - counts[first] + EAR_TEST_CHUNK, 'right')), first + 1)
+        chunk = np.arange(first, last)
+        pair_ear = np.repeat(chunk, counts[chunk])
+        pair_offset = np.arange(len(pair_ear)) - np.repeat(ends[chunk] - counts[chunk] - (ends[first] - counts[first]), counts[chunk])
+        pair_vert = reflex[orders[axis_of_ear[pair_ear], low[pair_ear] + pair_offset]]
+
+        p = points[pair_vert]
+        inside = pair_vert != (ears[pair_ear] - 1) % loop_length
+        inside &= pair_vert != (ears[pair_ear] + 1) % loop_length
+        for u, v in ((0, 1), (1, 2), (2, 0)):
+            a = corners[u, pair_ear]
+            b = corners[v, pair_ear]
+            inside &= orientation * ((b[:, 0] - a[:, 0]) * (p[:, 1] - a[:, 1])
+                                     - (b[:, 1] - a[:, 1]) * (p[:, 0] - a[:, 0])) >= 0
+        blocked[pair_ear[inside]] = True
+        first = last
+    return blocked
+
+
+# Close every chain of a polyline into a loop (open chains by their end-to-start chord) and
+# triangulate the loops as caps, projected onto the plane perpendicular to direction.
+# Loops nested inside an odd number of others are wound backwards, so they become holes.
+def cap_polyline(polyline, direction):
+    coords, edges, face_sizes, face_verts = polyline
+    path, chain, _, _ = polyline_chains(coords, edges, face_verts)
+    breaks = np.flatnonzero(np.diff(chain)) + 1
+    loops = []
+    for loop in np.split(path, breaks):
+        if len(loop) > 1 and loop[0] == loop[-1]:
+            loop = loop[:-1]
+        if len(loop) >= 3:
+            loops.append(loop)
+    if not loops:
+        return polyline
+
+    u, v = plane_basis(direction)
+    flat = [np.column_stack((coords[loop] @ u, coords[loop] @ v)) for loop in loops]
+    firsts = np.array([points[0] for points in flat])
+    depth = np.zeros(len(loops), dtype=np.int64)
+    for index, points in enumerate(flat):
+        contained = points_in_polygon(firsts, points)
+        contained[index] = False
+        depth += contained
+
+    triangles = []
+    for loop, points, nesting in zip(loops, flat, depth):
+        if (signed_area(points) >= 0) == (nesting % 2 == 1):
+            loop, points = loop[::-1], points[::-1]
+        triangles.append(loop[triangulate_polygon(points)])
+    cap_verts = np.concatenate(triangles).ravel()
+    cap_sizes = np.full(len(cap_verts) // 3, 3, dtype=np.int32)
+    return coords, edges, cap_sizes, cap_verts.astype(np.int32)
+
+
+# Newell normal of every face, unnormalized.
+def face_area_vectors(verts, face_sizes, face_verts):
+    corners = verts[face_verts]
+    return np.add.reduceat(np.cross(corners, verts[face_verts[loop_next_index(face_sizes)]]),
+                           face_starts(face_sizes))
+
+
+# Wind every fill face so that its normal points along direction, which makes it the top
+# cap of the prism built from it.
+def orient_faces(polyline, direction):
+    coords, edges, face_sizes, face_verts = polyline
+    if len(face_sizes) == 0:
+        return polyline
+    backwards = face_area_vectors(coords, face_sizes, face_verts) @ np.asarray(direction) < 0
+    if not backwards.any():
+        return polyline
+    flipped = reverse_face_winding(face_sizes, face_verts)
+    use_flipped = np.repeat(backwards, face_sizes)
+    return coords, edges, face_sizes, np.where(use_flipped, flipped, face_verts)
+
+
+# Whether faces form closed, consistently wound surfaces: every directed edge is used once
+# and its reverse is used once by a neighbouring face.
+def is_closed_manifold(face_sizes, face_verts):
+    if len(face_sizes) == 0:
+        return False
+    a = face_verts.astype(np.int64)
+    b = a[loop_next_index(face_sizes)]
+    stride = int(a.max()) + 1
+    keys = a * stride + b
+    if np.any(a == b) or len(np.unique(keys)) != len(keys):
+        return False
+    return bool(np.isin(b * stride + a, keys).all())
+
+
+# Extrude a polyline (and any fill faces) along direction into a prism. The outline is
+# first moved back by depth_offset, then extruded by depth + depth_offset, like the
+# translate + extrude_region_move it replaces. direction and depth_offset may also be given
+# per point, as (N, 3) and (N, 1) arrays.
+def build_prism(coords, edges, face_sizes, face_verts, direction, depth, depth_offset):
+    vert_count = len(coords)
+    direction = np.asarray(direction, dtype=np.float64)
+    base = coords - direction * depth_offset
+    top = coords + direction * depth
+    verts = np.concatenate((base, top))
+
+    # Side walls on loose edges and, in face winding order, on the fill's boundary
+    face_edge_keys = edge_keys(face_verts, face_verts[loop_next_index(face_sizes)], vert_count)
+    loose = ~np.isin(edge_keys(edges[:, 0], edges[:, 1], vert_count), face_edge_keys)
+    boundary_a, boundary_b = boundary_loop_edges(face_sizes, face_verts)
+    a = np.concatenate((edges[loose, 0], boundary_a))
+    b = np.concatenate((edges[loose, 1], boundary_b))
+    wall_loops = np.column_stack((a, b, b + vert_count, a + vert_count)).ravel()
+    wall_sizes = np.full(len(a), 4, dtype=np.int32)
+
+    # Fill faces become a reversed bottom cap and a translated top cap
+    bottom_loops = reverse_face_winding(face_sizes, face_verts)
+    top_loops = face_verts + vert_count
+
+    sizes = np.concatenate((wall_sizes, face_sizes, face_sizes)).astype(np.int32)
+    loops = np.concatenate((wall_loops, bottom_loops, top_loops)).astype(np.int32)
+    return verts, sizes, loops
+
+
+# Unit normals of every face; degenerate faces get a zero normal.
+def unit_face_normals(verts, face_sizes, face_verts):
+    face_area = face_area_vectors(verts, face_sizes, face_verts)
+    lengths = np.linalg.norm(face_area, axis=1)
+    lengths[lengths == 0] = 1
+    return face_area / lengths[:, None]
+
+
+# Unit vertex normals: the normalized sum of the unit normals of the faces around each
+# vertex. Vertices whose face normals cancel take the average face normal instead.
+def vertex_normals(verts, face_sizes, face_verts, face_normals=None):
+    if face_normals is None:
+        face_normals = unit_face_normals(verts, face_sizes, face_verts)
+    corner_faces = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    normals = np.column_stack([np.bincount(face_verts, face_normals[corner_faces, axis], minlength=len(verts))
+                               for axis in range(3)])
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 1e-12
+    normals[valid] /= lengths[valid, None]
+
+    if not valid.all():
+        fallback = face_normals.sum(axis=0)
+        length = np.linalg.norm(fallback)
+        normals[~valid] = fallback / length if length > 0 else (0.0, 0.0, 1.0)
+    return normals
+
+
+# Largest factor a shell offset is stretched by at a sharp corner
+MAX_MITER_SCALE = 4.0
+
+
+# Shell faces by thickness along their vertex normals: a reversed copy at -thickness/2, a
+# copy at +thickness/2 and walls bridging their boundary edges, in one set of arrays.
+# Offsets are mitered: where faces meet at an angle, the vertex normal makes half that
+# angle with each face, so the offset is divided by its cosine to keep every face
+# exactly thickness/2 from its copies.
+def shell_faces(verts, face_sizes, face_verts, thickness):
+    vert_count = len(verts)
+    face_normals = unit_face_normals(verts, face_sizes, face_verts)
+    normals = vertex_normals(verts, face_sizes, face_verts, face_normals)
+    corner_faces = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    cosines = np.einsum('ij,ij->i', normals[face_verts], face_normals[corner_faces])
+    corner_counts = np.bincount(face_verts, np.any(face_normals[corner_faces], axis=1), minlength=vert_count)
+    mean_cosine = np.bincount(face_verts, cosines, minlength=vert_count) / np.maximum(corner_counts, 1)
+    scale = 1 / np.clip(mean_cosine, 1 / MAX_MITER_SCALE, 1)
+    offset = normals * (scale * thickness / 2)[:, None]
+    shell_verts = np.concatenate((verts - offset, verts + offset))
+
+    a, b = boundary_loop_edges(face_sizes, face_verts)
+    wall_loops = np.column_stack((a, b, b + vert_count, a + vert_count)).ravel()
+    wall_sizes = np.full(len(a), 4, dtype=np.int32)
+
+    sizes = np.concatenate((face_sizes, face_sizes, wall_sizes)).astype(np.int32)
+    loops = np.concatenate((reverse_face_winding(face_sizes, face_verts),
+                            face_verts + vert_count, wall_loops)).astype(np.int32)
+    return shell_verts, sizes, loops
+
+
+# The outline a cutter is extruded from: the polyline simplified and, with watertight set,
+# capped. A thickness shell of the side walls is closed already, so it is never capped.
+# This is the slow part of building a cutter, and depends on neither depth nor winding.
+def cutter_outline(polyline, direction, thickness=None, simplify_tolerance=None, watertight=False, stats=None):
+    if simplify_tolerance:
+        polyline = simplify_polyline(polyline, simplify_tolerance, direction, stats)
+    if watertight and thickness is None:
+        if len(polyline[2]) == 0:
+            polyline = cap_polyline(polyline, direction)
+        else:
+            polyline = orient_faces(polyline, direction)
+    return polyline
+
+
+# Extrude a cutter outline into a prism, flip its normals and shell it by thickness.
+# Prisms with caps and shells are closed solids that always face outward, so only open
+# wall-only cutters are flipped.
+# With an eye (local space) every point is extruded along its own ray from the eye into a
+# frustum; direction is then the central view direction, and the offset back towards the
+# eye stops short of it.
+def extrude_cutter(outline, direction, depth, depth_offset, flip_normals=False, thickness=None, eye=None):
+    coords, edges, face_sizes, face_verts = outline
+    if eye is not None:
+        rays = perspective_rays(coords, eye, direction)
+        eye_depth = np.linalg.norm(coords - eye, axis=1) / np.linalg.norm(direction)
+        depth_offset = np.minimum(depth_offset, 0.99 * eye_depth)[:, None]
+        direction = rays
+    verts, sizes, loops = build_prism(coords, edges, face_sizes, face_verts, direction, depth, depth_offset)
+
+    if flip_normals and is_flippable(outline, thickness):
+        loops = reverse_face_winding(sizes, loops)
+
+    if thickness is not None:
+        verts, sizes, loops = shell_faces(verts, sizes, loops, thickness)
+    return verts, sizes, loops
+
+
+# Whether flip_normals changes the cutter extruded from outline: only when it is open.
+def is_flippable(outline, thickness=None):
+    return thickness is None and len(outline[2]) == 0
+
+
+# The whole cutter pipeline for one polyline in the local space of its object:
+# cutter_outline followed by extrude_cutter.
+def build_cutter(polyline, direction, depth, depth_offset, flip_normals=False, thickness=None,
+                 simplify_tolerance=None, watertight=False, stats=None, eye=None):
+    outline = cutter_outline(polyline, direction, thickness, simplify_tolerance, watertight, stats)
+    return extrude_cutter(outline, direction, depth, depth_offset, flip_normals, thickness, eye)
+
+
+# Patterns are (n, 4, 4) world matrices, each applied after the cutter's own to place one
+# instance. These ones only translate.
+def translation_matrices(offsets):
+    matrices = np.tile(np.eye(4), (len(offsets), 1, 1))
+    matrices[:, :3, 3] = offsets
+    return matrices
+
+
+# count instances step apart, and with rows > 1 that line repeated row_step apart.
+def grid_pattern(count, step, rows=1, row_step=(0.0, 0.0, 0.0)):
+    i, j = np.meshgrid(np.arange(count), np.arange(rows), indexing="xy")
+    offsets = i.ravel()[:, None] * np.asarray(step, dtype=np.float64) \
+        + j.ravel()[:, None] * np.asarray(row_step, dtype=np.float64)
+    return translation_matrices(offsets)
+
+
+# count instances rotated around the axis through pivot, spread over angle. A full turn
+# does not repeat the first instance at the end.
+def radial_pattern(count, pivot, axis, angle=2 * np.pi):
+    axis = np.asarray(axis, dtype=np.float64)
+    axis = axis / np.linalg.norm(axis)
+    full_turn = np.isclose(abs(angle), 2 * np.pi)
+    angles = np.linspace(0.0, angle, count, endpoint=not full_turn or count == 1)
+
+    # Rodrigues' formula for every angle at once
+    cross = np.array(((0.0, -axis[2], axis[1]), (axis[2], 0.0, -axis[0]), (-axis[1], axis[0], 0.0)))
+    sin = np.sin(angles)[:, None, None]
+    cos = np.cos(angles)[:, None, None]
+    rotations = cos * np.eye(3) + sin * cross + (1 - cos) * np.outer(axis, axis)
+
+    pivot = np.asarray(pivot, dtype=np.float64)
+    matrices = np.tile(np.eye(4), (count, 1, 1))
+    matrices[:, :3, :3] = rotations
+    matrices[:, :3, 3] = pivot - rotations @ pivot
+    return matrices
+
+
+# count points spread evenly by arc length over the edges of a guide polyline, taken in
+# order. A closed guide does not repeat its first point at the end.
+def points_along_edges(coords, edges, count):
+    if len(edges) == 0:
+        return coords[:1].repeat(count, axis=0) if len(coords) else np.zeros((count, 3))
+    a = coords[edges[:, 0]]
+    b = coords[edges[:, 1]]
+    lengths = np.linalg.norm(b - a, axis=1)
+    ends = np.cumsum(lengths)
+    total = ends[-1]
+    closed = edges[-1, 1] == edges[0, 0]
+    distances = np.linspace(0.0, total, count, endpoint=not closed or count == 1)
+
+    edge = np.minimum(np.searchsorted(ends, distances, side="right"), len(edges) - 1)
+    along = distances - (ends[edge] - lengths[edge])
+    t = np.divide(along, lengths[edge], out=np.zeros_like(along), where=lengths[edge] > 0)
+    return a[edge] + (b[edge] - a[edge]) * np.clip(t, 0.0, 1.0)[:, None]
+
+
+# Instances moved along a guide: the first sits where the cutter is, the others are
+# translated by the guide points' offsets from the first one.
+def guide_pattern(coords, edges, count):
+    points = points_along_edges(coords, edges, count)
+    return translation_matrices(points - points[0])
+
+
+# World bounds of every instance of a mesh with the given world bounds, as (n, 2, 3).
+def instance_bounds(bounds, matrices):
+    corners = np.array(np.meshgrid(*zip(bounds[0], bounds[1]), indexing="ij")).reshape(3, -1).T
+    moved = corners @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, None, :3, 3]
+    return np.stack((moved.min(axis=1), moved.max(axis=1)), axis=1)
+
+
+# Which instances overlap at least one of the (min, max) target bounds.
+def instances_overlapping(bounds, matrices, targets):
+    boxes = instance_bounds(bounds, matrices)
+    keep = np.zeros(len(matrices), dtype=bool)
+    for low, high in targets:
+        keep |= np.all(boxes[:, 0] <= high, axis=1) & np.all(low <= boxes[:, 1], axis=1)
+    return keep
+
+
+# Whether any two of the (n, 2, 3) (min, max) boxes overlap or touch. Boxes are swept in
+# order of their lower x, so each is only compared with those starting before it ends.
+def boxes_overlap_any(boxes):
+    if len(boxes) < 2:
+        return False
+    boxes = boxes[np.argsort(boxes[:, 0, 0], kind="stable")]
+    ends = np.searchsorted(boxes[:, 0, 0], boxes[:, 1, 0], side="right")
+    counts = np.maximum(ends - np.arange(len(boxes)) - 1, 0)
+    first = np.repeat(np.arange(len(boxes)), counts)
+    second = first + 1 + np.arange(len(first)) - np.repeat(face_starts(counts), counts)
+    return bool(np.any(np.all(boxes[second, 0] <= boxes[first, 1], axis=1)
+                       & np.all(boxes[first, 0] <= boxes[second, 1], axis=1)))
+
+
+# One mesh holding a copy of verts and faces per matrix.
+def replicate_mesh(verts, face_sizes, face_verts, matrices):
+    moved = verts @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, None, :3, 3]
+    offsets = np.arange(len(matrices)) * len(verts)
+    loops = (face_verts[None, :] + offsets[:, None]).ravel()
+    return moved.reshape(-1, 3), np.tile(face_sizes, len(matrices)), loops.astype(np.int32)
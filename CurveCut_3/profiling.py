@@ -0,0 +1,91 @@
+# Per-stage timing and memory instrumentation for CurveSlice Pro operators. Nothing in here
+# imports bpy: the addon opens a run around an operator and wraps each of its stages.
+#
+# Memory is the tracemalloc peak of the stage, so it covers Python and NumPy allocations
+# but not memory Blender allocates in C (mesh data, boolean solves).
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Finished runs, oldest first
+runs = []
+
+# The run stages are currently recorded into, or None
+_active_run = None
+
+
+# Record the stages of one operator call. Runs do not nest: a run opened inside another
+# one (an operator calling another) records into the outer run.
+@contextmanager
+def profile_run(operator, enabled=True, history=5, log_path="", info=None):
+    global _active_run
+    if not enabled or _active_run is not None:
+        yield None
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    run = {"operator": operator, "time": time.time(), "stages": []}
+    run.update(info or {})
+    _active_run = run
+    start = time.perf_counter()
+    try:
+        yield run
+    except BaseException as exc:
+        run["error"] = repr(exc)
+        raise
+    finally:
+        _active_run = None
+        run["seconds"] = time.perf_counter() - start
+        if started_tracing:
+            tracemalloc.stop()
+        runs.append(run)
+        del runs[:max(len(runs) - history, 0)]
+        if log_path:
+            append_log(log_path, run)
+
+
+# Time one stage of the active run. The yielded record takes extra fields, such as the
+# vertex and face counts going in and out; stages must not nest.
+@contextmanager
+def stage(name, **fields):
+    run = _active_run
+    record = {"stage": name}
+    record.update(fields)
+    if run is None:
+        yield record
+        return
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = time.perf_counter() - start
+        record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        run["stages"].append(record)
+
+
+# Append a run as one JSON line, for comparing runs across addon versions.
+def append_log(path, run):
+    with open(path, "a", encoding="utf-8") as log:
+        log.write(json.dumps(run, default=str) + "\n")
+
+
+# One line summary of a stage record for the panel.
+def describe_stage(record):
+    parts = [f"{record['stage']}: {record.get('seconds', 0.0) * 1000:.1f} ms"]
+    for kind in ("verts", "faces"):
+        count_in = record.get(f"{kind}_in")
+        count_out = record.get(f"{kind}_out")
+        if count_in is not None and count_out is not None:
+            parts.append(f"{kind} {count_in} > {count_out}")
+        elif count_out is not None:
+            parts.append(f"{kind} {count_out}")
+    if record.get("solver"):
+        parts.append(record["solver"] + (" after Fast failed" if record.get("fallback") else ""))
+    if record.get("peak_bytes"):
+        parts.append(f"{record['peak_bytes'] / 2 ** 20:.1f} MB")
+    return ", ".join(parts)
@@ -0,0 +1,130 @@
+# Headless benchmarks for the CurveSlice Pro geometry core.
+#
+# Runs every cutter stage over synthetic curves and reports throughput and peak memory:
+#
+#     python benchmarks/bench_geometry.py
+#     python benchmarks/bench_geometry.py --sizes 1000 100000 --json results.jsonl
+#     blender -b --python benchmarks/bench_geometry.py -- --sizes 100000
+#
+# With bpy available (Blender in background mode, or the bpy wheel) the mesh write done by
+# the addon is benchmarked as well.
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "CurveCut_3"))
+
+import geometry  # noqa: E402
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+
+
+# A closed, wobbly outline with n points, plus the same outline filled by one n-gon.
+def synthetic_curve(n, filled=False, seed=0):
+    rng = np.random.default_rng(seed)
+    angle = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    radius = 1 + 0.1 * np.sin(7 * angle) + 0.01 * rng.standard_normal(n)
+    coords = np.column_stack((radius * np.cos(angle), radius * np.sin(angle), np.zeros(n)))
+    edges = np.column_stack((np.arange(n), (np.arange(n) + 1) % n)).astype(np.int32)
+    if filled:
+        return coords, edges, np.array([n], dtype=np.int32), np.arange(n, dtype=np.int32)
+    return coords, edges, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+
+
+# One cyclic Bezier spline through the outline points, with smooth (Catmull-Rom) handles.
+def bezier_spline(coords):
+    tangent = (np.roll(coords, -1, axis=0) - np.roll(coords, 1, axis=0)) / 6
+    return (coords, coords - tangent, coords + tangent,
+            np.array([len(coords)], dtype=np.int64), np.array([True]))
+
+
+def stages(polyline):
+    direction = geometry.view_direction((0.9238795, 0.3826834, 0.0, 0.0))
+    matrix = np.diag((2.0, 2.0, 2.0, 1.0))
+    coords, edges, face_sizes, face_verts = polyline
+    prism = geometry.build_prism(coords, edges, face_sizes, face_verts, direction, 1.0, 0.5)
+    verts, sizes, loops = prism
+    grid = geometry.grid_pattern(4, (3.0, 0.0, 0.0), 4, (0.0, 3.0, 0.0))
+
+    yield "projection", lambda: geometry.to_local_direction(matrix, direction), len(coords)
+    yield "tessellate", lambda: geometry.tessellate_bezier(*bezier_spline(coords), 0.001), len(coords)
+    yield "simplify", lambda: geometry.simplify_polyline(polyline, 0.001, direction), len(coords)
+    yield "cap", lambda: geometry.cap_polyline(polyline, direction), len(coords)
+    yield "prism", lambda: geometry.build_prism(coords, edges, face_sizes, face_verts, direction, 1.0, 0.5), len(coords)
+    yield "flip", lambda: geometry.reverse_face_winding(sizes, loops), len(loops)
+    yield "shell", lambda: geometry.shell_faces(verts, sizes, loops, 0.1), len(verts)
+    yield "pattern", lambda: geometry.replicate_mesh(verts, sizes, loops, grid), len(verts) * len(grid)
+    yield "cutter", lambda: geometry.build_cutter(polyline, direction, 1.0, 0.5, flip_normals=True,
+                                                  thickness=0.1, simplify_tolerance=0.001), len(coords)
+    yield "perspective", lambda: geometry.build_cutter(polyline, direction, 1.0, 0.5, watertight=True,
+                                                       eye=-10.0 * direction), len(coords)
+    if bpy is not None:
+        yield "mesh_write", lambda: write_mesh_roundtrip(verts, sizes, loops), len(verts)
+
+
+# Write a cutter into a new mesh datablock the way the addon does, then remove it.
+def write_mesh_roundtrip(verts, sizes, loops):
+    sys.path.insert(0, ROOT)
+    from CurveCut_3 import write_mesh
+
+    mesh = bpy.data.meshes.new("bench")
+    write_mesh(mesh, verts, sizes, loops)
+    bpy.data.meshes.remove(mesh)
+
+
+def measure(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="append results as JSON lines to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'curve':>8} {'points':>9} {'stage':>11} {'time ms':>10} {'Mpts/s':>9} {'peak MB':>9}")
+    for size in args.sizes:
+        for filled in (False, True):
+            polyline = synthetic_curve(size, filled=filled)
+            kind = "filled" if filled else "outline"
+            for stage, func, count in stages(polyline):
+                seconds, peak = measure(func, args.repeat)
+                throughput = count / seconds / 1e6 if seconds else float("inf")
+                print(f"{kind:>8} {size:>9} {stage:>11} {seconds * 1000:>10.3f} {throughput:>9.2f} {peak / 2 ** 20:>9.2f}")
+                results.append({
+                    "curve": kind, "points": size, "stage": stage, "seconds": seconds,
+                    "points_per_second": count / seconds if seconds else None, "peak_bytes": peak,
+                    "numpy": np.__version__, "bpy": bpy.app.version_string if bpy else None,
+                })
+
+    if args.json:
+        with open(args.json, "a") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:])
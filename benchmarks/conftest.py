@@ -0,0 +1,19 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--bench-large", action="store_true",
+                     help="also benchmark the 100k and 1M point curves")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "large: benchmark on a large curve, run with --bench-large")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench-large"):
+        return
+    skip = pytest.mark.skip(reason="large curve; run with --bench-large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,45 @@
+# pytest-benchmark suite over the same stages and synthetic curves as bench_geometry.py.
+# Curves of 100k points and more only run with --bench-large. Throughput and the Python
+# memory peak of every stage are stored in extra_info, so saved runs can be compared:
+#
+#     python -m pytest benchmarks --benchmark-only
+#     python -m pytest benchmarks --benchmark-only --bench-large --benchmark-autosave --benchmark-compare
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import bench_geometry  # noqa: E402
+
+# Curves at least this large are marked large
+LARGE_SIZE = 100000
+
+STAGES = ("projection", "tessellate", "simplify", "cap", "prism", "flip", "shell", "pattern", "cutter",
+          "perspective")
+
+
+@pytest.fixture(scope="module", params=[
+    pytest.param((size, filled), id=f"{'filled' if filled else 'outline'}-{size}",
+                 marks=[pytest.mark.large] if size >= LARGE_SIZE else [])
+    for size in bench_geometry.DEFAULT_SIZES for filled in (False, True)])
+def curve_stages(request):
+    size, filled = request.param
+    return {stage: (func, count) for stage, func, count in bench_geometry.stages(
+        bench_geometry.synthetic_curve(size, filled=filled))}
+
+
+@pytest.mark.parametrize("stage", STAGES)
+def test_stage(benchmark, curve_stages, stage):
+    func, count = curve_stages[stage]
+    benchmark.group = stage
+    benchmark(func)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    benchmark.extra_info["points"] = count
+    benchmark.extra_info["peak_bytes"] = peak
+    if benchmark.stats is not None and benchmark.stats.stats.mean:
+        benchmark.extra_info["points_per_second"] = count / benchmark.stats.stats.mean
@@ -0,0 +1,208 @@
+# Headless batch cutting with CurveSlice Pro: applies curve cuts listed in a job spec to many
+# .blend files, spread over a pool of background Blender processes.
+#
+#     blender -b --python scripts/batch_cut.py -- jobs.csv --workers 4
+#     python scripts/batch_cut.py jobs.json --blender /path/to/blender --report results.jsonl
+#
+# A job spec is a JSON list of objects or a CSV file with a header, with the fields:
+#
+#     file          .blend file to cut (relative paths are relative to the spec)
+#     curve         name of the curve or grease pencil object to cut with
+#     target        name of the mesh to cut
+#     direction     cut direction as "x y z", or a view name: TOP, BOTTOM, FRONT, BACK, LEFT, RIGHT
+#     depth         optional, cutter depth (default 1.0)
+#     depth_offset  optional, how far the cutter starts behind the curve (default 0.0)
+#     cut_through   optional, true to cut through the whole target
+#     thickness     optional, cut a slot of this thickness along the curve instead of its area
+#     output        optional, where to save the result (default: overwrite file)
+#
+# Jobs on the same file run in order in one Blender process, which saves the file once. Each
+# job's status and timing is printed as a JSON line and optionally appended to --report.
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+# Prefix of the lines a worker prints its job results on
+RESULT_PREFIX = "CURVESLICE_RESULT "
+
+# Cut directions of the standard views: the direction each view looks in
+VIEW_DIRECTIONS = {
+    "TOP": (0.0, 0.0, -1.0),
+    "BOTTOM": (0.0, 0.0, 1.0),
+    "FRONT": (0.0, 1.0, 0.0),
+    "BACK": (0.0, -1.0, 0.0),
+    "RIGHT": (-1.0, 0.0, 0.0),
+    "LEFT": (1.0, 0.0, 0.0),
+}
+
+TRUE_WORDS = {"1", "true", "yes", "on"}
+
+
+def read_jobs(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            jobs = json.load(f)
+        else:
+            jobs = [{key: value for key, value in row.items() if value not in (None, "")}
+                    for row in csv.DictReader(f)]
+
+    base = os.path.dirname(os.path.abspath(path))
+    for index, job in enumerate(jobs):
+        job["index"] = index
+        for key in ("file", "output"):
+            if job.get(key):
+                job[key] = os.path.join(base, job[key])
+    return jobs
+
+
+def parse_direction(value):
+    if isinstance(value, str) and value.upper() in VIEW_DIRECTIONS:
+        return VIEW_DIRECTIONS[value.upper()]
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    direction = tuple(float(component) for component in value)
+    if len(direction) != 3 or not any(direction):
+        raise ValueError(f"invalid cut direction {value!r}")
+    length = sum(component * component for component in direction) ** 0.5
+    return tuple(component / length for component in direction)
+
+
+def parse_bool(value):
+    return value if isinstance(value, bool) else str(value).strip().lower() in TRUE_WORDS
+
+
+# Worker side: runs inside a background Blender that has the job file open.
+
+def load_addon():
+    sys.path.insert(0, ROOT)
+    import CurveCut_3
+    if not hasattr(bpy.types.Scene, "curve_slice_pro_properties"):
+        CurveCut_3.register()
+    return CurveCut_3
+
+
+def run_job(addon, job):
+    context = bpy.context
+    props = context.scene.curve_slice_pro_properties
+    source = bpy.data.objects[job["curve"]]
+    target = bpy.data.objects[job["target"]]
+    thickness = float(job.get("thickness", 0) or 0)
+
+    props.cut_mode = True
+    props.multi_target = False
+    props.batch_cut = False
+    props.non_destructive = False
+    props.keep_curve_post_cut = False
+    props.cut_target = target
+    props.depth = float(job.get("depth", 1.0))
+    props.depth_offset = float(job.get("depth_offset", 0.0))
+    props.cut_through = parse_bool(job.get("cut_through", False))
+    props.set_thickness = thickness > 0
+    props.thickness = thickness
+    props.simplify_units = 'WORLD'
+
+    messages = []
+    faces_before = len(target.data.polygons)
+    addon.cut_headless(context, source, parse_direction(job["direction"]),
+                       lambda _level, message: messages.append(message))
+    return {"faces_before": faces_before, "faces_after": len(target.data.polygons), "messages": messages}
+
+
+def run_worker(jobs):
+    addon = load_addon()
+    saved = False
+    for job in jobs:
+        start = time.perf_counter()
+        result = {"index": job["index"], "file": job["file"], "curve": job.get("curve"),
+                  "target": job.get("target")}
+        try:
+            result.update(run_job(addon, job))
+            result["status"] = "ok"
+            saved = True
+        except Exception as exc:
+            result.update(status="error", error=f"{type(exc).__name__}: {exc}")
+        result["seconds"] = time.perf_counter() - start
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+    if saved:
+        output = next((job["output"] for job in jobs if job.get("output")), jobs[0]["file"])
+        bpy.ops.wm.save_as_mainfile(filepath=output)
+
+
+# Driver side: groups the jobs by file and runs one background Blender per file.
+
+def run_file(blender, jobs, timeout):
+    command = [blender, "-b", "--factory-startup", jobs[0]["file"], "--python", os.path.abspath(__file__),
+               "--", "--worker", json.dumps(jobs)]
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return [dict(index=job["index"], file=job["file"], status="timeout",
+                     seconds=time.perf_counter() - start) for job in jobs]
+
+    results = [json.loads(line[len(RESULT_PREFIX):]) for line in process.stdout.splitlines()
+               if line.startswith(RESULT_PREFIX)]
+    finished = {result["index"] for result in results}
+    for job in jobs:
+        if job["index"] not in finished:
+            results.append(dict(index=job["index"], file=job["file"], status="error",
+                                error=f"Blender exited with code {process.returncode}: {process.stderr[-500:]}"))
+    return results
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Apply CurveSlice Pro cuts to many .blend files.")
+    parser.add_argument("jobs", nargs="?", help="JSON or CSV job spec")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of Blender processes run at once")
+    parser.add_argument("--blender", default=bpy.app.binary_path if bpy else "blender",
+                        help="Blender executable for the workers")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per file")
+    parser.add_argument("--report", help="append job results as JSON lines to this file")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(json.loads(args.worker))
+        return 0
+    if not args.jobs:
+        parser.error("a job spec is required")
+
+    jobs = read_jobs(args.jobs)
+    by_file = {}
+    for job in jobs:
+        by_file.setdefault(job["file"], []).append(job)
+
+    failed = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        futures = [pool.submit(run_file, args.blender, file_jobs, args.timeout) for file_jobs in by_file.values()]
+        for future in futures:
+            for result in sorted(future.result(), key=lambda result: result["index"]):
+                failed += result["status"] != "ok"
+                line = json.dumps(result)
+                print(line, flush=True)
+                if args.report:
+                    with open(args.report, "a", encoding="utf-8") as report:
+                        report.write(line + "\n")
+
+    print(f"{len(jobs) - failed} of {len(jobs)} jobs succeeded on {len(by_file)} files "
+          f"in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
@@ -0,0 +1,6 @@
+# The geometry core only needs NumPy, so it is imported directly rather than through the
+# addon package, which needs bpy.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "CurveCut_3"))
@@ -0,0 +1,214 @@
+import numpy as np
+import pytest
+
+import geometry
+
+
+# A closed, wobbly outline with n points in the XY plane.
+def outline(n, seed=0):
+    rng = np.random.default_rng(seed)
+    angle = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    radius = 1 + 0.1 * np.sin(7 * angle) + 0.01 * rng.standard_normal(n)
+    coords = np.column_stack((radius * np.cos(angle), radius * np.sin(angle), np.zeros(n)))
+    edges = np.column_stack((np.arange(n), (np.arange(n) + 1) % n)).astype(np.int32)
+    return coords, edges, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+
+
+def reversed_outline(polyline):
+    coords, edges, face_sizes, face_verts = polyline
+    return coords[::-1].copy(), edges, face_sizes, face_verts
+
+
+def triangle_areas(points, triangles):
+    a, b, c = (points[triangles[:, i]] for i in range(3))
+    return ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])) / 2
+
+
+@pytest.mark.parametrize("points", [
+    np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float64),
+    np.array([(0, 0), (4, 0), (4, 3), (2, 1), (0, 3)], dtype=np.float64),
+    np.array([(np.cos(a) * r, np.sin(a) * r) for a, r in
+              zip(np.linspace(0, 2 * np.pi, 10, endpoint=False), [1, 0.4] * 5)]),
+    outline(500)[0][:, :2],
+    outline(500)[0][::-1, :2],
+])
+def test_triangulate_polygon_covers_polygon(points):
+    triangles = geometry.triangulate_polygon(points)
+    assert triangles.shape == (len(points) - 2, 3)
+    areas = triangle_areas(points, triangles)
+    area = geometry.signed_area(points) / 2
+    assert np.all(np.sign(areas[np.abs(areas) > 1e-12]) == np.sign(area))
+    assert areas.sum() == pytest.approx(area)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("direction", [(0.0, 0.0, -1.0), (0.0, 0.0, 1.0), (0.3, 0.0, -1.0)])
+def test_watertight_cutter_is_closed_and_outward(reverse, direction):
+    polyline = outline(400)
+    if reverse:
+        polyline = reversed_outline(polyline)
+    direction = np.array(direction) / np.linalg.norm(direction)
+    verts, sizes, loops = geometry.build_cutter(polyline, direction, 1.0, 0.5, watertight=True)
+    assert geometry.is_closed_manifold(sizes, loops)
+
+    # Prism volume: cap area perpendicular to direction times the full extrusion length
+    area = abs(geometry.signed_area(polyline[0][:, :2])) / 2 * abs(direction[2])
+    assert geometry.signed_volume(verts, sizes, loops) == pytest.approx(area * 1.5, rel=1e-6)
+
+
+@pytest.mark.parametrize("thickness", [None, 0.1])
+def test_flip_normals_keeps_closed_cutters_outward(thickness):
+    polyline = outline(200)
+    direction = np.array((0.0, 0.0, -1.0))
+    verts, sizes, loops = geometry.build_cutter(polyline, direction, 1.0, 0.5, flip_normals=True,
+                                                thickness=thickness, watertight=True)
+    assert geometry.is_closed_manifold(sizes, loops)
+    assert geometry.signed_volume(verts, sizes, loops) > 0
+
+    walls = geometry.build_cutter(polyline, direction, 1.0, 0.5)
+    flipped = geometry.build_cutter(polyline, direction, 1.0, 0.5, flip_normals=True)
+    assert np.array_equal(flipped[2], geometry.reverse_face_winding(walls[1], walls[2]))
+
+
+def test_watertight_perspective_cutter_is_closed_and_outward():
+    direction = np.array((0.0, 0.0, -1.0))
+    verts, sizes, loops = geometry.build_cutter(outline(300), direction, 1.0, 0.5, watertight=True,
+                                                eye=np.array((0.0, 0.0, 10.0)))
+    assert geometry.is_closed_manifold(sizes, loops)
+    assert geometry.signed_volume(verts, sizes, loops) > 0
+
+
+def test_wall_only_cutter_is_open():
+    verts, sizes, loops = geometry.build_cutter(outline(100), (0.0, 0.0, -1.0), 1.0, 0.0)
+    assert len(sizes) == 100
+    assert not geometry.is_closed_manifold(sizes, loops)
+
+
+# Distance from every point to the closest of the given segments.
+def distance_to_segments(points, starts, ends):
+    distances = [geometry.point_segment_distance(points, np.broadcast_to(a, points.shape),
+                                                 np.broadcast_to(b, points.shape))
+                 for a, b in zip(starts, ends)]
+    return np.min(distances, axis=0)
+
+
+@pytest.mark.parametrize("tolerance", [0.001, 0.01, 0.05])
+def test_simplify_polyline_stays_within_tolerance(tolerance):
+    polyline = outline(2000)
+    stats = {}
+    coords, edges, _, _ = geometry.simplify_polyline(polyline, tolerance, stats=stats)
+    assert stats["points_in"] == 2000
+    assert stats["points_out"] == len(coords) < 2000
+    assert len(edges) == len(coords)
+    assert np.all(np.bincount(edges.ravel()) == 2)
+    deviation = distance_to_segments(polyline[0], coords[edges[:, 0]], coords[edges[:, 1]])
+    assert deviation.max() <= tolerance + 1e-12
+
+
+def test_simplify_polyline_ignores_depth_along_direction():
+    coords, edges, face_sizes, face_verts = outline(1000)
+    coords = coords.copy()
+    coords[:, 2] = np.sin(np.arange(len(coords)))
+    simple = geometry.simplify_polyline((coords, edges, face_sizes, face_verts), 0.01, (0.0, 0.0, 1.0))
+    flat = geometry.simplify_polyline(outline(1000), 0.01)
+    assert len(simple[0]) == len(flat[0])
+
+
+def test_simplify_polyline_keeps_open_chain_ends():
+    x = np.linspace(0, 1, 50)
+    coords = np.column_stack((x, 0.001 * np.sin(40 * x), np.zeros(50)))
+    edges = np.column_stack((np.arange(49), np.arange(1, 50))).astype(np.int32)
+    empty = np.zeros(0, dtype=np.int32)
+    simple, simple_edges, _, _ = geometry.simplify_polyline((coords, edges, empty, empty), 0.01)
+    assert len(simple) == 2
+    assert np.allclose(simple, coords[[0, -1]])
+    assert simple_edges.tolist() == [[0, 1]]
+
+
+def filled(polyline):
+    coords, edges, _, _ = polyline
+    return coords, edges, np.array([len(coords)], dtype=np.int32), np.arange(len(coords), dtype=np.int32)
+
+
+def test_simplify_polyline_recaps_filled_outline():
+    polyline = filled(outline(2000))
+    stats = {}
+    coords, edges, face_sizes, face_verts = geometry.simplify_polyline(polyline, 0.01, stats=stats)
+    assert stats["points_out"] == len(coords) == len(geometry.simplify_polyline(outline(2000), 0.01)[0])
+    assert "fill_kept" not in stats
+    assert np.all(face_sizes == 3) and len(face_sizes) == len(coords) - 2
+    area = geometry.face_area_vectors(coords, face_sizes, face_verts).sum(axis=0) / 2
+    assert area[2] == pytest.approx(geometry.signed_area(polyline[0][:, :2]) / 2, rel=1e-2)
+
+    verts, sizes, loops = geometry.build_cutter(polyline, (0.0, 0.0, -1.0), 1.0, 0.0, simplify_tolerance=0.01)
+    assert geometry.is_closed_manifold(sizes, loops)
+    assert geometry.signed_volume(verts, sizes, loops) > 0
+
+
+def test_simplify_polyline_keeps_fill_with_inner_vertices():
+    # A fan around a centre vertex: the centre is not on the outline, so the fill is kept
+    coords, edges, _, _ = outline(100)
+    coords = np.vstack((coords, (0.0, 0.0, 0.0)))
+    ring = np.arange(100)
+    face_verts = np.column_stack((ring, (ring + 1) % 100, np.full(100, 100))).ravel().astype(np.int32)
+    spokes = np.column_stack((ring, np.full(100, 100)))
+    edges = np.concatenate((edges, spokes)).astype(np.int32)
+    stats = {}
+    simple = geometry.simplify_polyline((coords, edges, np.full(100, 3, dtype=np.int32), face_verts), 0.05,
+                                        stats=stats)
+    assert stats["fill_kept"]
+    assert len(simple[0]) == 101
+
+
+@pytest.mark.parametrize("thickness", [0.2, 0.05])
+def test_shell_walls_keep_full_thickness_at_corners(thickness):
+    coords = np.array([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], dtype=np.float64)
+    edges = np.array([(0, 1), (1, 2), (2, 3), (3, 0)], dtype=np.int32)
+    empty = np.zeros(0, dtype=np.int32)
+    verts, sizes, loops = geometry.build_cutter((coords, edges, empty, empty), (0.0, 0.0, -1.0), 1.0, 0.0,
+                                                thickness=thickness)
+    assert geometry.is_closed_manifold(sizes, loops)
+    # Every shell vertex lies on the square grown or shrunk by exactly thickness/2
+    extent = np.abs(verts[:, :2]).max(axis=1)
+    assert np.allclose(np.sort(np.unique(np.round(extent, 9))), [1 - thickness / 2, 1 + thickness / 2])
+
+
+@pytest.mark.parametrize("spacing, expected", [(3.0, False), (1.5, True), (2.0, True)])
+def test_boxes_overlap_any_finds_overlapping_pattern_copies(spacing, expected):
+    bounds = (np.array((-1.0, -1.0, 0.0)), np.array((1.0, 1.0, 1.0)))
+    matrices = geometry.grid_pattern(4, (spacing, 0.0, 0.0), 3, (0.0, 5.0, 0.0))
+    assert geometry.boxes_overlap_any(geometry.instance_bounds(bounds, matrices)) == expected
+
+
+def test_boxes_overlap_any_compares_all_axes():
+    boxes = np.array([[(0, 0, 0), (1, 1, 1)], [(0.5, 2, 0), (1.5, 3, 1)], [(0.2, 0.5, 2), (0.8, 0.8, 3)]],
+                     dtype=np.float64)
+    assert not geometry.boxes_overlap_any(boxes)
+    assert geometry.boxes_overlap_any(np.concatenate((boxes, [[(0.9, 2.5, 0.5), (2, 4, 2)]])))
+
+
+# Points of cubic Bezier segments p0..p3 at parameters t.
+def bezier_points(p0, p1, p2, p3, t):
+    s = (1 - t)[:, None]
+    t = t[:, None]
+    return s ** 3 * p0 + 3 * s * s * t * p1 + 3 * s * t * t * p2 + t ** 3 * p3
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-2])
+def test_tessellate_bezier_stays_within_tolerance(seed, tolerance):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-2, 2, (4, 3))
+    handles_left = points + rng.uniform(-2, 2, (4, 3))
+    handles_right = points + rng.uniform(-2, 2, (4, 3))
+    if seed == 0:
+        points[:2] = (0, 0, 0), (1, 0, 0)
+        handles_right[0], handles_left[1] = (3, 0.3, 0), (-2, 0.3, 0)
+    coords, edges, _, _ = geometry.tessellate_bezier(points, handles_left, handles_right, [4], [True], tolerance)
+    assert len(edges) == len(coords)
+
+    t = np.linspace(0, 1, 400)
+    samples = np.concatenate([bezier_points(points[i], handles_right[i], handles_left[(i + 1) % 4],
+                                            points[(i + 1) % 4], t) for i in range(4)])
+    deviation = distance_to_segments(samples, coords[edges[:, 0]], coords[edges[:, 1]])
+    assert deviation.max() <= tolerance * (1 + 1e-9)